@@ -12,10 +12,14 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from notebook_config import get_last_notebook, set_last_notebook
-from browser_utils import browser_session, StealthUtils, find_and_click, find_and_fill
-from config import SOURCES_TAB_SELECTORS, ADD_SOURCE_BUTTON_SELECTORS
-from list_notebooks import list_notebooks
+from notebook_config import get_last_notebook, set_last_notebook, set_cached_sources, find_notebook_by_name
+from browser_utils import browser_session, StealthUtils, find_and_click, find_and_fill, wait_and_click_text
+from config import (
+    SOURCES_TAB_SELECTORS, ADD_SOURCE_BUTTON_SELECTORS, NOTEBOOKLM_URL_RE, NOTEBOOK_ID_RE,
+    SOURCE_ROW_NOISE_RE,
+)
+
+YOUTUBE_URL_RE = re.compile(r'youtube\.com/watch|youtu\.be/|youtube\.com/embed/')
 
 # Website/Link option in the add source dialog
 WEBSITE_OPTION_SELECTORS = [
@@ -56,6 +60,9 @@ URL_INPUT_SELECTORS = [
     'textarea:visible',
 ]
 
+# The multi-line "Paste any links" field, the only one that takes several links
+URL_TEXTAREA_SELECTORS = [s for s in URL_INPUT_SELECTORS if s.startswith('textarea')]
+
 # Submit/Add button
 SUBMIT_BUTTON_SELECTORS = [
     'button:has-text("Insert")',
@@ -65,6 +72,22 @@ SUBMIT_BUTTON_SELECTORS = [
     '[data-test-id="submit-source"]',
 ]
 
+# "Upload files" option in the add-source dialog
+UPLOAD_OPTION_SELECTORS = [
+    'button:has-text("Upload files")',
+    'button:has-text("Upload")',
+    ':has-text("Upload files"):not(:has(*))',
+    '[aria-label*="upload" i]',
+    'button:has(mat-icon:has-text("upload"))',
+]
+
+# File input behind the upload option
+FILE_INPUT_SELECTORS = [
+    'input[type="file"]',
+    'input[accept*="pdf"]',
+    'input[accept*="text"]',
+]
+
 
 def _count_sources(page) -> int:
     """Count sources using mat-checkbox elements (same approach as list_sources.py)."""
@@ -74,7 +97,7 @@ def _count_sources(page) -> int:
         for (const cb of checkboxes) {
             const row = cb.closest('[class*="source"]') || cb.parentElement?.parentElement || cb.parentElement;
             if (!row) continue;
-            const text = (row.innerText || '').toLowerCase();
+            const text = (row.textContent || '').toLowerCase();
             if (text.indexOf('select all') >= 0) continue;
             count++;
         }
@@ -82,14 +105,220 @@ def _count_sources(page) -> int:
     }''')
 
 
+def _source_names(page) -> list[str]:
+    """
+    Names of the sources in the Sources panel.
+
+    A row's name is its first line that isn't an icon/UI token. Tokens are
+    dropped by exact match, not by length, so short file names such as
+    "notes.txt" are kept.
+    """
+    return page.evaluate('''(noise) => {
+        const noiseRe = new RegExp(noise, 'i');
+        const names = [];
+        for (const cb of document.querySelectorAll('mat-checkbox')) {
+            const row = cb.closest('[class*="source"]') || cb.parentElement?.parentElement || cb.parentElement;
+            if (!row) continue;
+            const text = row.innerText || row.textContent || '';
+            if (text.toLowerCase().indexOf('select all') >= 0) continue;
+            for (const raw of text.split('\\n')) {
+                const line = raw.trim();
+                if (!line || noiseRe.test(line)) continue;
+                names.push(line);
+                break;
+            }
+        }
+        return names;
+    }''', SOURCE_ROW_NOISE_RE)
+
+
 def is_youtube_url(url: str) -> bool:
     """Check if URL is a YouTube video"""
-    youtube_patterns = [
-        r'youtube\.com/watch',
-        r'youtu\.be/',
-        r'youtube\.com/embed/',
-    ]
-    return any(re.search(pattern, url) for pattern in youtube_patterns)
+    return YOUTUBE_URL_RE.search(url) is not None
+
+
+def _open_notebook(page, notebook_url: str):
+    """
+    Navigate to a notebook and switch to the Sources tab.
+
+    Args:
+        page: Playwright page object
+        notebook_url: NotebookLM notebook URL
+    """
+    print("  🌐 Opening notebook...")
+    page.goto(notebook_url, wait_until="domcontentloaded")
+
+    # Wait for NotebookLM to load
+    page.wait_for_url(NOTEBOOKLM_URL_RE, timeout=15000)
+
+    # Step 0: Click on Sources tab first (find_and_click waits for it to render)
+    print("  🔍 Clicking Sources tab...")
+    if not find_and_click(page, SOURCES_TAB_SELECTORS, "Sources tab", timeout=5000):
+        print("  ⚠️ Could not find Sources tab, continuing anyway...")
+
+    StealthUtils.random_delay(1000, 1500)
+
+
+def _add_url_on_open_page(page, notebook_url: str, source_urls: list[str]) -> list[dict]:
+    """
+    Add URL sources through one add-source dialog on an already open notebook.
+
+    The Websites dialog's textarea accepts several links separated by
+    newlines, so a batch of website URLs is submitted in one go when that
+    textarea is there (otherwise one dialog per link). YouTube URLs must be
+    passed one at a time.
+
+    Args:
+        page: Playwright page object (notebook already loaded)
+        notebook_url: NotebookLM notebook URL (for the result dicts)
+        source_urls: URLs of the same type (websites, or a single YouTube URL)
+
+    Returns:
+        List of result dicts, one per URL
+    """
+    is_youtube = is_youtube_url(source_urls[0])
+    source_type = "YouTube" if is_youtube else "Website"
+
+    for source_url in source_urls:
+        print(f"📎 Adding {source_type} source: {source_url}")
+
+    # Step 1: Click "Add source" button
+    print("  🔍 Looking for Add source button...")
+    if not find_and_click(page, ADD_SOURCE_BUTTON_SELECTORS, "Add source button"):
+        # Try clicking on the sources panel first
+        try:
+            sources_panel = page.query_selector('[data-panel="sources"]')
+            if sources_panel:
+                sources_panel.click()
+                StealthUtils.random_delay(500, 1000)
+                if not find_and_click(page, ADD_SOURCE_BUTTON_SELECTORS, "Add source button"):
+                    raise Exception("Could not find Add source button")
+        except Exception:
+            raise Exception("Could not find Add source button")
+
+    # Step 2: Select source type (Website or YouTube)
+    # find_and_click waits for the option itself, so no fixed delay for the dialog
+    print(f"  🔍 Selecting {source_type}...")
+
+    option_texts = ["YouTube"] if is_youtube else ["Websites", "Website"]
+    option_selectors = YOUTUBE_OPTION_SELECTORS if is_youtube else WEBSITE_OPTION_SELECTORS
+    if not (wait_and_click_text(page, option_texts, f"{source_type} option")
+            or find_and_click(page, option_selectors, f"{source_type} option")):
+        raise Exception(f"Could not find {source_type} option")
+
+    # Wait for the URL input to appear instead of a fixed delay
+    try:
+        page.wait_for_selector('textarea, input[type="url"]', state="visible", timeout=5000)
+    except Exception:
+        pass
+
+    # Several links only fit in one dialog through the multi-line "Paste any
+    # links" textarea; a single-line <input> strips the newlines and would
+    # glue them into one bogus URL. Without a textarea, the first link goes in
+    # this dialog and the rest each get their own.
+    rest = []
+    if len(source_urls) > 1 and page.locator('textarea:visible').count() == 0:
+        print("  ⚠️ URL field is single-line, adding the links one dialog at a time")
+        source_urls, rest = source_urls[:1], source_urls[1:]
+
+    # Step 3: Enter URL(s)
+    print("  📝 Entering URL...")
+    input_selectors = URL_TEXTAREA_SELECTORS if len(source_urls) > 1 else URL_INPUT_SELECTORS
+    if not find_and_fill(page, input_selectors, "\n".join(source_urls), "URL input"):
+        raise Exception("Could not find URL input field")
+
+    StealthUtils.random_delay(300, 600)
+
+    # Count sources before submitting
+    count_before = _count_sources(page)
+    print(f"  📊 Sources before: {count_before}")
+
+    # Step 4: Submit
+    print("  📤 Submitting...")
+    if not find_and_click(page, SUBMIT_BUTTON_SELECTORS, "Submit button"):
+        # Try pressing Enter as fallback
+        page.keyboard.press("Enter")
+        print("  ✓ Pressed Enter to submit")
+
+    results = _wait_for_url_sources(page, notebook_url, source_urls, source_type, count_before)
+
+    for source_url in rest:
+        StealthUtils.random_delay(500, 1000)
+        try:
+            results.extend(_add_url_on_open_page(page, notebook_url, [source_url]))
+        except Exception as e:
+            print(f"  ❌ Error: {e}")
+            results.append({"status": "error", "error": str(e), "source_url": source_url})
+            # Close any dialog left open before the next link
+            page.keyboard.press("Escape")
+
+    return results
+
+
+def _wait_for_url_sources(page, notebook_url: str, source_urls: list[str], source_type: str,
+                          count_before: int) -> list[dict]:
+    """
+    Wait for a submitted dialog's URLs to show up in the Sources panel.
+
+    The panel only tells us how many sources there are, not which link became
+    which, so a batch that grows the count only partly (a link failed or was a
+    duplicate) is reported as an error for every URL in it rather than guessed.
+
+    Returns:
+        List of result dicts, one per URL
+    """
+    # Step 5: Wait for source(s) to be indexed
+    print("  ⏳ Waiting for source to be added...")
+    StealthUtils.random_delay(2000, 3000)
+
+    # Click Sources tab to ensure we see the updated list
+    find_and_click(page, SOURCES_TAB_SELECTORS, "Sources tab", timeout=5000)
+
+    max_wait = 120  # URL sources need server-side processing
+    start_time = time.time()
+    count_now = count_before
+
+    while time.time() - start_time < max_wait:
+        # Check for error messages
+        try:
+            error_element = page.query_selector('.error-message, [role="alert"]')
+            if error_element and error_element.is_visible():
+                error_text = error_element.inner_text()
+                if error_text:
+                    raise Exception(f"Error adding source: {error_text}")
+        except Exception as e:
+            if "Error adding source" in str(e):
+                raise
+
+        # Check if source count increased by the whole batch
+        count_now = _count_sources(page)
+        if count_now >= count_before + len(source_urls):
+            print(f"  ✅ Source added successfully! (sources: {count_before} → {count_now})")
+            return [{
+                "status": "success",
+                "source_url": source_url,
+                "source_type": source_type,
+                "notebook_url": notebook_url
+            } for source_url in source_urls]
+
+        time.sleep(3)
+
+    added = count_now - count_before
+    if len(source_urls) > 1:
+        print(f"  ❌ Only {max(added, 0)} of {len(source_urls)} links appeared (verification timeout)")
+        error = (f"Only {max(added, 0)} of {len(source_urls)} links submitted together were added; "
+                 "check the notebook to see which")
+        return [{"status": "error", "error": error, "source_url": source_url} for source_url in source_urls]
+
+    # Single link: no error found, so assume it worked
+    print("  ✅ Source submission completed (verification timeout)")
+    return [{
+        "status": "success",
+        "source_url": source_urls[0],
+        "source_type": source_type,
+        "notebook_url": notebook_url,
+        "note": "Could not verify source was added, please check manually"
+    }]
 
 
 def add_url_source(notebook_url: str, source_url: str, headless: bool = True) -> dict:
@@ -104,121 +333,162 @@ def add_url_source(notebook_url: str, source_url: str, headless: bool = True) ->
     Returns:
         Dict with status and details
     """
-    is_youtube = is_youtube_url(source_url)
-    source_type = "YouTube" if is_youtube else "Website"
-
-    print(f"📎 Adding {source_type} source: {source_url}")
     print(f"📚 Notebook: {notebook_url}")
+    # The notebook's cached source list is about to go stale
+    set_cached_sources(notebook_url, None)
 
     try:
         with browser_session(headless=headless) as page:
-            print("  🌐 Opening notebook...")
-            page.goto(notebook_url, wait_until="domcontentloaded")
+            _open_notebook(page, notebook_url)
+            return _add_url_on_open_page(page, notebook_url, [source_url])[0]
 
-            # Wait for NotebookLM to load
-            page.wait_for_url(re.compile(r"^https://notebooklm\.google\.com/"), timeout=15000)
-            StealthUtils.random_delay(1000, 2000)
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return {"status": "error", "error": str(e)}
 
-            # Step 0: Click on Sources tab first
-            print("  🔍 Clicking Sources tab...")
-            if not find_and_click(page, SOURCES_TAB_SELECTORS, "Sources tab", timeout=5000):
-                print("  ⚠️ Could not find Sources tab, continuing anyway...")
 
-            StealthUtils.random_delay(1000, 1500)
+def _print_source_result(result: dict):
+    """Print the one-line outcome for a single URL or file source"""
+    label = result.get("source_url") or result.get("file_name", "")
+    if result["status"] == "success":
+        print(f"✅ Added {result.get('source_type', 'URL')} source: {label}")
+        if result.get("note"):
+            print(f"   Note: {result['note']}")
+    elif result["status"] == "skipped":
+        print(f"⏭️  Skipped: {label}")
+    else:
+        print(f"❌ Failed: {label} - {result.get('error', 'Unknown error')}")
 
-            # Step 1: Click "Add source" button
-            print("  🔍 Looking for Add source button...")
-            if not find_and_click(page, ADD_SOURCE_BUTTON_SELECTORS, "Add source button"):
-                # Try clicking on the sources panel first
-                try:
-                    sources_panel = page.query_selector('[data-panel="sources"]')
-                    if sources_panel:
-                        sources_panel.click()
-                        StealthUtils.random_delay(500, 1000)
-                        if not find_and_click(page, ADD_SOURCE_BUTTON_SELECTORS, "Add source button"):
-                            raise Exception("Could not find Add source button")
-                except Exception:
-                    raise Exception("Could not find Add source button")
 
-            StealthUtils.random_delay(1500, 2500)  # Wait longer for dialog to appear
+def add_url_sources(notebook_url: str, source_urls: list[str], headless: bool = True,
+                    fail_fast: bool = False) -> list[dict]:
+    """
+    Add several URL sources in one browser session (see add_sources)
+
+    Args:
+        notebook_url: NotebookLM notebook URL
+        source_urls: URLs to add as sources (websites or YouTube)
+        headless: Run browser in headless mode
+        fail_fast: Stop after the first failed batch; remaining URLs are skipped
 
-            # Step 2: Select source type (Website or YouTube)
-            print(f"  🔍 Selecting {source_type}...")
+    Returns:
+        List of result dicts, one per URL in input order (same shape as add_url_source)
+    """
+    return add_sources(notebook_url, [{"type": "url", "url": url} for url in source_urls],
+                       headless=headless, fail_fast=fail_fast)
 
-            option_selectors = YOUTUBE_OPTION_SELECTORS if is_youtube else WEBSITE_OPTION_SELECTORS
-            if not find_and_click(page, option_selectors, f"{source_type} option"):
-                raise Exception(f"Could not find {source_type} option")
 
-            StealthUtils.random_delay(1500, 2500)  # Wait for dialog to change
+def _add_file_on_open_page(page, notebook_url: str, file_path: Path) -> dict:
+    """
+    Upload one file through the add-source dialog on an already open notebook.
 
-            # Step 3: Enter URL
-            print("  📝 Entering URL...")
-            if not find_and_fill(page, URL_INPUT_SELECTORS, source_url, "URL input"):
-                raise Exception("Could not find URL input field")
+    Args:
+        page: Playwright page object (notebook already loaded)
+        notebook_url: NotebookLM notebook URL (for the result dict)
+        file_path: Resolved path of an existing local file
 
-            StealthUtils.random_delay(300, 600)
+    Returns:
+        Result dict for the file, with the notebook's source names after the upload
+    """
+    file_name = file_path.name
 
-            # Count sources before submitting
-            count_before = _count_sources(page)
-            print(f"  📊 Sources before: {count_before}")
+    # Step 1: Click "Add source" or "Upload" button
+    print("  🔍 Looking for upload option...")
 
-            # Step 4: Submit
-            print("  📤 Submitting...")
-            if not find_and_click(page, SUBMIT_BUTTON_SELECTORS, "Submit button"):
-                # Try pressing Enter as fallback
-                page.keyboard.press("Enter")
-                print("  ✓ Pressed Enter to submit")
+    # First try to find and click Add source button
+    find_and_click(page, ADD_SOURCE_BUTTON_SELECTORS, "Add source button", timeout=5000)
 
-            # Step 5: Wait for source to be indexed
-            print("  ⏳ Waiting for source to be added...")
-            StealthUtils.random_delay(2000, 3000)
+    # Now look for "Upload files" option or file input
+    # The dialog opens asynchronously; wait for the option in-page rather than sleeping
+    upload_clicked = (wait_and_click_text(page, ["Upload files"], "Upload files")
+                      or find_and_click(page, UPLOAD_OPTION_SELECTORS, "Upload files", timeout=5000))
+    StealthUtils.random_delay(1000, 1500)
 
-            # Click Sources tab to ensure we see the updated list
-            find_and_click(page, SOURCES_TAB_SELECTORS, "Sources tab", timeout=5000)
+    # Count sources before uploading
+    count_before = _count_sources(page)
+    print(f"  📊 Sources before: {count_before}")
 
-            max_wait = 120  # URL sources need server-side processing
-            start_time = time.time()
+    # Step 2: Find file input and upload
+    print("  📤 Uploading file...")
 
-            while time.time() - start_time < max_wait:
-                # Check for error messages
-                try:
-                    error_element = page.query_selector('.error-message, [role="alert"]')
-                    if error_element and error_element.is_visible():
-                        error_text = error_element.inner_text()
-                        if error_text:
-                            raise Exception(f"Error adding source: {error_text}")
-                except Exception as e:
-                    if "Error adding source" in str(e):
-                        raise
-
-                # Check if source count increased
-                count_now = _count_sources(page)
-                if count_now > count_before:
-                    print(f"  ✅ Source added successfully! (sources: {count_before} → {count_now})")
-                    return {
-                        "status": "success",
-                        "source_url": source_url,
-                        "source_type": source_type,
-                        "notebook_url": notebook_url
-                    }
-
-                time.sleep(3)
-
-            # If we get here, assume it worked (no error found)
-            print("  ✅ Source submission completed (verification timeout)")
+    # Look for file input element (might be hidden)
+    file_input = None
+    for selector in FILE_INPUT_SELECTORS:
+        try:
+            file_input = page.query_selector(selector)
+            if file_input:
+                break
+        except Exception:
+            continue
+
+    if file_input:
+        # Use set_input_files to upload
+        file_input.set_input_files(str(file_path))
+        print(f"  ✓ Selected file: {file_name}")
+    else:
+        # Try using page.set_input_files with a more general approach
+        # Sometimes the input is dynamically created
+        try:
+            # Wait for any file input to appear
+            file_input = page.wait_for_selector('input[type="file"]', timeout=5000)
+            if file_input:
+                file_input.set_input_files(str(file_path))
+                print(f"  ✓ Selected file: {file_name}")
+            else:
+                raise Exception("Could not find file input element")
+        except Exception:
+            raise Exception("Could not find file input element for upload")
+
+    # Step 3: Wait for upload to complete
+    print("  ⏳ Waiting for upload to complete...")
+    StealthUtils.random_delay(2000, 3000)
+
+    # Click Sources tab to ensure we see the updated list
+    find_and_click(page, SOURCES_TAB_SELECTORS, "Sources tab", timeout=5000)
+
+    max_wait = 120  # 2 minutes max for file upload
+    start_time = time.time()
+
+    while time.time() - start_time < max_wait:
+        # Check for error messages
+        try:
+            error_element = page.query_selector('.error-message, [role="alert"]')
+            if error_element and error_element.is_visible():
+                error_text = error_element.inner_text()
+                if error_text and "error" in error_text.lower():
+                    raise Exception(f"Upload error: {error_text}")
+        except Exception as e:
+            if "Upload error" in str(e):
+                raise
+
+        # Check if source count increased
+        count_now = _count_sources(page)
+        if count_now > count_before:
+            print(f"  ✅ File uploaded successfully! (sources: {count_before} → {count_now})")
             return {
                 "status": "success",
-                "source_url": source_url,
-                "source_type": source_type,
+                "file_path": str(file_path),
+                "file_name": file_name,
+                "source_type": "File",
                 "notebook_url": notebook_url,
-                "note": "Could not verify source was added, please check manually"
+                "sources": _source_names(page)
             }
 
-    except Exception as e:
-        print(f"  ❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
-        return {"status": "error", "error": str(e)}
+        time.sleep(3)
+
+    # Assume success if no error
+    print("  ✅ Upload completed (verification timeout)")
+    return {
+        "status": "success",
+        "file_path": str(file_path),
+        "file_name": file_name,
+        "source_type": "File",
+        "notebook_url": notebook_url,
+        "sources": _source_names(page),
+        "note": "Could not verify file was added, please check manually"
+    }
 
 
 def add_file_source(notebook_url: str, file_path: str, headless: bool = True) -> dict:
@@ -231,171 +501,138 @@ def add_file_source(notebook_url: str, file_path: str, headless: bool = True) ->
         headless: Run browser in headless mode
 
     Returns:
-        Dict with status and details
+        Dict with status and details ("sources" lists the notebook's source
+        names after the upload, so callers can verify it without list_sources)
     """
     # Validate file exists
     file_path = Path(file_path).resolve()
     if not file_path.exists():
         return {"status": "error", "error": f"File not found: {file_path}"}
 
-    file_name = file_path.name
-    print(f"📄 Uploading file: {file_name}")
+    print(f"📄 Uploading file: {file_path.name}")
     print(f"📚 Notebook: {notebook_url}")
+    # The notebook's cached source list is about to go stale
+    set_cached_sources(notebook_url, None)
 
     try:
         with browser_session(headless=headless) as page:
-            print("  🌐 Opening notebook...")
-            page.goto(notebook_url, wait_until="domcontentloaded")
-
-            # Wait for NotebookLM to load
-            page.wait_for_url(re.compile(r"^https://notebooklm\.google\.com/"), timeout=15000)
-            StealthUtils.random_delay(2000, 3000)
-
-            # Step 1: Click on Sources tab
-            print("  🔍 Clicking Sources tab...")
-            find_and_click(page, SOURCES_TAB_SELECTORS, "Sources tab", timeout=5000)
-            StealthUtils.random_delay(1000, 1500)
-
-            # Step 2: Click "Add source" or "Upload" button
-            print("  🔍 Looking for upload option...")
-
-            # First try to find and click Add source button
-            add_clicked = find_and_click(page, ADD_SOURCE_BUTTON_SELECTORS, "Add source button", timeout=5000)
-            if add_clicked:
-                StealthUtils.random_delay(1000, 2000)
-
-            # Now look for "Upload files" option or file input
-            upload_selectors = [
-                'button:has-text("Upload files")',
-                'button:has-text("Upload")',
-                ':has-text("Upload files"):not(:has(*))',
-                '[aria-label*="upload" i]',
-                'button:has(mat-icon:has-text("upload"))',
-            ]
-
-            upload_clicked = find_and_click(page, upload_selectors, "Upload files", timeout=5000)
-            StealthUtils.random_delay(1000, 1500)
-
-            # Count sources before uploading
-            count_before = _count_sources(page)
-            print(f"  📊 Sources before: {count_before}")
-
-            # Step 3: Find file input and upload
-            print("  📤 Uploading file...")
-
-            # Look for file input element (might be hidden)
-            file_input_selectors = [
-                'input[type="file"]',
-                'input[accept*="pdf"]',
-                'input[accept*="text"]',
-            ]
-
-            file_input = None
-            for selector in file_input_selectors:
-                try:
-                    file_input = page.query_selector(selector)
-                    if file_input:
-                        break
-                except Exception:
-                    continue
+            _open_notebook(page, notebook_url)
+            return _add_file_on_open_page(page, notebook_url, file_path)
 
-            if file_input:
-                # Use set_input_files to upload
-                file_input.set_input_files(str(file_path))
-                print(f"  ✓ Selected file: {file_name}")
-            else:
-                # Try using page.set_input_files with a more general approach
-                # Sometimes the input is dynamically created
-                try:
-                    # Wait for any file input to appear
-                    file_input = page.wait_for_selector('input[type="file"]', timeout=5000)
-                    if file_input:
-                        file_input.set_input_files(str(file_path))
-                        print(f"  ✓ Selected file: {file_name}")
-                    else:
-                        raise Exception("Could not find file input element")
-                except Exception:
-                    raise Exception("Could not find file input element for upload")
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return {"status": "error", "error": str(e)}
+
+
+def _unreached_results(kind: str, items: list, **fields) -> list[dict]:
+    """Result dicts for a batch that never ran (session error or fail-fast skip)"""
+    if kind == "url":
+        return [{**fields, "source_url": url} for _, url in items]
+    return [{**fields, "file_path": str(path), "file_name": path.name} for _, path in items]
 
-            # Step 4: Wait for upload to complete
-            print("  ⏳ Waiting for upload to complete...")
-            StealthUtils.random_delay(2000, 3000)
 
-            # Click Sources tab to ensure we see the updated list
-            find_and_click(page, SOURCES_TAB_SELECTORS, "Sources tab", timeout=5000)
+def add_sources(notebook_url: str, sources: list[dict], headless: bool = True,
+                fail_fast: bool = False) -> list[dict]:
+    """
+    Add a mix of URL and file sources in one browser session
+
+    The notebook is opened once. All website URLs are pasted into a single
+    Websites dialog; YouTube URLs and files each go through their own
+    dialog on the same page.
+
+    Args:
+        notebook_url: NotebookLM notebook URL
+        sources: Dicts like {"type": "url", "url": ...} or {"type": "file", "path": ...}
+        headless: Run browser in headless mode
+        fail_fast: Stop after the first failed batch; remaining sources are skipped
 
-            max_wait = 120  # 2 minutes max for file upload
-            start_time = time.time()
+    Returns:
+        List of result dicts, one per source in input order (same shapes as
+        add_url_source and add_file_source)
+    """
+    print(f"📚 Notebook: {notebook_url}")
+    # The notebook's cached source list is about to go stale
+    set_cached_sources(notebook_url, None)
+    results = [None] * len(sources)
+
+    # Batch items keep their input index so results come back in input order
+    urls = [(i, s["url"]) for i, s in enumerate(sources) if s["type"] == "url"]
+    websites = [(i, url) for i, url in urls if not is_youtube_url(url)]
+    batches = [("url", websites)] if websites else []
+    batches += [("url", [(i, url)]) for i, url in urls if is_youtube_url(url)]
+    batches += [("file", [(i, Path(s["path"]).resolve())])
+                for i, s in enumerate(sources) if s["type"] == "file"]
+
+    def record(items, batch_results):
+        for (i, _), r in zip(items, batch_results):
+            _print_source_result(r)
+            results[i] = r
+
+    done = 0
+    try:
+        with browser_session(headless=headless) as page:
+            _open_notebook(page, notebook_url)
 
-            while time.time() - start_time < max_wait:
-                # Check for error messages
+            for kind, items in batches:
                 try:
-                    error_element = page.query_selector('.error-message, [role="alert"]')
-                    if error_element and error_element.is_visible():
-                        error_text = error_element.inner_text()
-                        if error_text and "error" in error_text.lower():
-                            raise Exception(f"Upload error: {error_text}")
+                    if kind == "url":
+                        batch_results = _add_url_on_open_page(page, notebook_url,
+                                                              [url for _, url in items])
+                    elif not items[0][1].exists():
+                        batch_results = _unreached_results(kind, items, status="error",
+                                                           error=f"File not found: {items[0][1]}")
+                    else:
+                        print(f"📄 Uploading file: {items[0][1].name}")
+                        batch_results = [_add_file_on_open_page(page, notebook_url, items[0][1])]
                 except Exception as e:
-                    if "Upload error" in str(e):
-                        raise
-
-                # Check if source count increased
-                count_now = _count_sources(page)
-                if count_now > count_before:
-                    print(f"  ✅ File uploaded successfully! (sources: {count_before} → {count_now})")
-                    return {
-                        "status": "success",
-                        "file_path": str(file_path),
-                        "file_name": file_name,
-                        "source_type": "File",
-                        "notebook_url": notebook_url
-                    }
-
-                time.sleep(3)
-
-            # Assume success if no error
-            print("  ✅ Upload completed (verification timeout)")
-            return {
-                "status": "success",
-                "file_path": str(file_path),
-                "file_name": file_name,
-                "source_type": "File",
-                "notebook_url": notebook_url,
-                "note": "Could not verify file was added, please check manually"
-            }
+                    print(f"  ❌ Error: {e}")
+                    batch_results = _unreached_results(kind, items, status="error", error=str(e))
+                    # Close any dialog left open before the next batch
+                    page.keyboard.press("Escape")
+
+                # Report each source as soon as its batch finishes
+                record(items, batch_results)
+                done += 1
+
+                if fail_fast and any(r["status"] != "success" for r in batch_results):
+                    for kind, items in batches[done:]:
+                        record(items, _unreached_results(kind, items, status="skipped"))
+                    done = len(batches)
+                    break
+                StealthUtils.random_delay(500, 1000)
 
     except Exception as e:
         print(f"  ❌ Error: {e}")
         import traceback
         traceback.print_exc()
-        return {"status": "error", "error": str(e)}
+        # Sources not reached before the session failed
+        for kind, items in batches[done:]:
+            record(items, _unreached_results(kind, items, status="error", error=str(e)))
 
-
-def find_notebook_by_name(name: str) -> dict | None:
-    """Find notebook by name (fuzzy match)"""
-    result = list_notebooks(headless=True)
-    if result["status"] != "success":
-        return None
-    for nb in result["notebooks"]:
-        if name.lower() in nb.get("name", "").lower():
-            return nb
-    return None
+    return results
 
 
 def main():
     parser = argparse.ArgumentParser(description='Add source to NotebookLM (URL or local file)')
 
-    # Source options (mutually exclusive)
-    source_group = parser.add_mutually_exclusive_group(required=True)
-    source_group.add_argument('--url', help='URL to add as source (website or YouTube)')
-    source_group.add_argument('--file', help='Local file to upload (PDF, TXT, MD, etc.)')
+    # Source options (repeatable, and may be mixed; all go in one browser session)
+    parser.add_argument('--url', action='append', default=[],
+                        help='URL to add as source (website or YouTube); repeat to add several in one session')
+    parser.add_argument('--file', action='append', default=[],
+                        help='Local file to upload (PDF, TXT, MD, etc.); repeat to add several in one session')
 
     parser.add_argument('--notebook-url', help='Full NotebookLM notebook URL')
     parser.add_argument('--notebook-id', help='Notebook UUID')
     parser.add_argument('--notebook-name', help='Notebook name (fuzzy match)')
+    parser.add_argument('--fail-fast', action='store_true',
+                        help='With several sources, stop at the first failure')
     parser.add_argument('--show-browser', action='store_true', help='Show browser for debugging')
 
     args = parser.parse_args()
+    if not args.url and not args.file:
+        parser.error("one of the arguments --url --file is required")
 
     # Resolve notebook URL (priority: url > id > name > last used)
     notebook_url = args.notebook_url
@@ -404,7 +641,7 @@ def main():
 
     if notebook_url:
         # Extract ID from URL
-        match = re.search(r'/notebook/([a-f0-9-]+)', notebook_url)
+        match = NOTEBOOK_ID_RE.search(notebook_url)
         if match:
             notebook_id = match.group(1)
 
@@ -442,28 +679,45 @@ def main():
             return 1
 
     # Call appropriate function based on source type
-    if args.file:
+    if len(args.file) == 1 and not args.url:
         result = add_file_source(
             notebook_url=notebook_url,
-            file_path=args.file,
+            file_path=args.file[0],
             headless=not args.show_browser
         )
     else:
-        result = add_url_source(
-            notebook_url=notebook_url,
-            source_url=args.url,
-            headless=not args.show_browser
-        )
+        if args.file:
+            sources = ([{"type": "url", "url": url} for url in args.url]
+                       + [{"type": "file", "path": path} for path in args.file])
+            results = add_sources(
+                notebook_url=notebook_url,
+                sources=sources,
+                headless=not args.show_browser,
+                fail_fast=args.fail_fast
+            )
+        else:
+            results = add_url_sources(
+                notebook_url=notebook_url,
+                source_urls=args.url,
+                headless=not args.show_browser,
+                fail_fast=args.fail_fast
+            )
+
+        succeeded = [r for r in results if r["status"] == "success"]
+        if succeeded and notebook_id:
+            # Auto-save last used notebook
+            set_last_notebook(notebook_id, notebook_name or "")
+
+        kind = "sources" if args.file else "URL sources"
+        print(f"\n📊 Added {len(succeeded)}/{len(results)} {kind}")
+        return 0 if len(succeeded) == len(results) else 1
 
     if result["status"] == "success":
         # Auto-save last used notebook
         if notebook_id:
             set_last_notebook(notebook_id, notebook_name or "")
 
-        if args.file:
-            print(f"\n✅ Uploaded file: {result['file_name']}")
-        else:
-            print(f"\n✅ Added {result.get('source_type', 'URL')} source: {result['source_url']}")
+        print(f"\n✅ Uploaded file: {result['file_name']}")
 
         if result.get("note"):
             print(f"   Note: {result['note']}")
@@ -12,15 +12,16 @@ See: https://github.com/microsoft/playwright/issues/36139
 import argparse
 import sys
 import time
-import re
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from notebook_config import get_last_notebook, set_last_notebook
-from config import QUERY_INPUT_SELECTORS, RESPONSE_SELECTORS, SOURCES_TAB_SELECTORS, CHAT_TAB_SELECTORS
-from browser_utils import browser_session, StealthUtils, find_and_click
-from list_notebooks import list_notebooks
+from notebook_config import get_last_notebook, set_last_notebook, set_cached_sources, find_notebook_by_name
+from config import (
+    QUERY_INPUT_SELECTORS, RESPONSE_SELECTORS, SOURCES_TAB_SELECTORS, CHAT_TAB_SELECTORS,
+    NOTEBOOKLM_URL_RE, NOTEBOOK_ID_RE, SOURCE_ROW_NOISE_RE,
+)
+from browser_utils import browser_session, StealthUtils, find_and_click, find_and_click_any
 
 
 # Follow-up reminder (adapted from MCP server for stateless operation)
@@ -34,6 +35,43 @@ FOLLOW_UP_REMINDER = (
 )
 
 
+DEACTIVATE_SOURCE_JS = '''(noise) => {
+    // Checked in-page: a navigation drops the helper even though the Page object survives
+    if (typeof window.__nblmDeactivateSource === 'function') return;
+    const noiseRe = new RegExp(noise, 'i');
+    window.__nblmDeactivateSource = (sourceNameLower) => {
+        const checkboxes = document.querySelectorAll('mat-checkbox');
+
+        for (const cb of checkboxes) {
+            const row = cb.closest('[class*="source"]') || cb.parentElement?.parentElement;
+            if (!row) continue;
+            // Match on textContent (no layout); innerText only for the matching row
+            const rowLower = (row.textContent || '').toLowerCase();
+
+            if (rowLower.includes(sourceNameLower) && !rowLower.includes('select all')) {
+                const rowText = row.innerText || '';
+
+                // Check if currently checked
+                const input = cb.querySelector('input[type="checkbox"]');
+                const isChecked = input ? input.checked :
+                                cb.classList.contains('mat-mdc-checkbox-checked');
+
+                if (isChecked && input) {
+                    input.click();
+                    // Get actual source name (filter out icon labels)
+                    const name = rowText.split('\\n').map(l => l.trim())
+                        .find(l => l && !noiseRe.test(l)) || sourceNameLower;
+                    return { found: true, clicked: true, name: name.substring(0, 60) };
+                } else if (!isChecked) {
+                    return { found: true, clicked: false, reason: 'already deactivated' };
+                }
+            }
+        }
+        return { found: false };
+    };
+}'''
+
+
 def deactivate_sources(page, exclude_sources: list[str]) -> int:
     """
     Deactivate (uncheck) specified sources in the current notebook.
@@ -50,55 +88,18 @@ def deactivate_sources(page, exclude_sources: list[str]) -> int:
 
     print(f"  🔇 Excluding sources: {', '.join(exclude_sources)}")
 
-    # Click Sources tab
-    for selector in SOURCES_TAB_SELECTORS:
-        try:
-            tab = page.wait_for_selector(selector, timeout=5000, state="visible")
-            if tab:
-                tab.click()
-                StealthUtils.random_delay(1000, 1500)
-                break
-        except:
-            continue
+    # Click Sources tab (all selectors raced in one wait)
+    if find_and_click_any(page, SOURCES_TAB_SELECTORS, "Sources tab", timeout=5000):
+        StealthUtils.random_delay(1000, 1500)
+
+    # Install the row matcher once per document instead of re-sending it for every source
+    page.evaluate(DEACTIVATE_SOURCE_JS, SOURCE_ROW_NOISE_RE)
 
     deactivated = 0
 
     for source_name in exclude_sources:
         # Find and click the checkbox for this source
-        result = page.evaluate('''(sourceName) => {
-            const sourceNameLower = sourceName.toLowerCase();
-            const checkboxes = document.querySelectorAll('mat-checkbox');
-
-            for (const cb of checkboxes) {
-                const row = cb.closest('[class*="source"]') || cb.parentElement?.parentElement;
-                if (!row) continue;
-                const rowText = row.innerText || '';
-
-                if (rowText.toLowerCase().indexOf(sourceNameLower) >= 0 &&
-                    rowText.toLowerCase().indexOf('select all') < 0) {
-
-                    // Check if currently checked
-                    const input = cb.querySelector('input[type="checkbox"]');
-                    const isChecked = input ? input.checked :
-                                    cb.classList.contains('mat-mdc-checkbox-checked');
-
-                    if (isChecked && input) {
-                        input.click();
-                        // Get actual source name (filter out icon labels)
-                        const lines = rowText.split('\\n').map(l => l.trim()).filter(l => l.length > 10);
-                        const nameLines = lines.filter(l => {
-                            const lower = l.toLowerCase();
-                            return lower !== 'markdown' && lower !== 'web' && lower !== 'youtube';
-                        });
-                        const name = nameLines[0] || sourceName;
-                        return { found: true, clicked: true, name: name.substring(0, 60) };
-                    } else if (!isChecked) {
-                        return { found: true, clicked: false, reason: 'already deactivated' };
-                    }
-                }
-            }
-            return { found: false };
-        }''', source_name)
+        result = page.evaluate("(n) => window.__nblmDeactivateSource(n)", source_name.lower())
 
         if result.get('clicked'):
             print(f"    ⬜ Deactivated: {result.get('name', source_name)}")
@@ -118,6 +119,10 @@ def deactivate_sources(page, exclude_sources: list[str]) -> int:
     except:
         pass
 
+    if deactivated:
+        # The cached source list still shows these sources as enabled
+        set_cached_sources(page.url, None)
+
     return deactivated
 
 
@@ -143,7 +148,7 @@ def ask_notebooklm(question: str, notebook_url: str, headless: bool = True, excl
             page.goto(notebook_url, wait_until="domcontentloaded")
 
             # Wait for NotebookLM
-            page.wait_for_url(re.compile(r"^https://notebooklm\.google\.com/"), timeout=10000)
+            page.wait_for_url(NOTEBOOKLM_URL_RE, timeout=10000)
             StealthUtils.random_delay(2000, 3000)
 
             # Click Chat tab (NotebookLM may load on Sources tab)
@@ -249,17 +254,6 @@ def ask_notebooklm(question: str, notebook_url: str, headless: bool = True, excl
         return None
 
 
-def find_notebook_by_name(name: str) -> dict | None:
-    """Find notebook by name (fuzzy match)"""
-    result = list_notebooks(headless=True)
-    if result["status"] != "success":
-        return None
-    for nb in result["notebooks"]:
-        if name.lower() in nb.get("name", "").lower():
-            return nb
-    return None
-
-
 def main():
     parser = argparse.ArgumentParser(description='Ask NotebookLM a question')
 
@@ -279,8 +273,7 @@ def main():
 
     if notebook_url:
         # Extract ID from URL
-        import re
-        match = re.search(r'/notebook/([a-f0-9-]+)', notebook_url)
+        match = NOTEBOOK_ID_RE.search(notebook_url)
         if match:
             notebook_id = match.group(1)
 
@@ -14,7 +14,6 @@ import json
 import time
 import argparse
 import shutil
-import re
 import sys
 from pathlib import Path
 from typing import Optional, Dict, Any
@@ -24,7 +23,7 @@ from patchright.sync_api import sync_playwright, BrowserContext
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from config import BROWSER_STATE_DIR, STATE_FILE, AUTH_INFO_FILE, DATA_DIR
+from config import BROWSER_STATE_DIR, STATE_FILE, AUTH_INFO_FILE, DATA_DIR, NOTEBOOKLM_URL_RE
 from browser_utils import BrowserFactory
 
 
@@ -126,7 +125,7 @@ class AuthManager:
             try:
                 # Wait for URL to change to NotebookLM (regex ensures it's the actual domain, not a parameter)
                 timeout_ms = int(timeout_minutes * 60 * 1000)
-                page.wait_for_url(re.compile(r"^https://notebooklm\.google\.com/"), timeout=timeout_ms)
+                page.wait_for_url(NOTEBOOKLM_URL_RE, timeout=timeout_ms)
 
                 print(f"  ✅ Login successful!")
 
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Long-lived browser for NotebookLM skill scripts
+Keeps one persistent Chrome context running so successive commands attach
+to it over CDP instead of paying a full browser launch each time.
+"""
+
+import argparse
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from config import DAEMON_STATE_FILE, DAEMON_IDLE_TIMEOUT_MINUTES
+
+
+def _free_port() -> int:
+    """Pick an unused local TCP port for the DevTools endpoint"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except OSError:
+        return False
+    return True
+
+
+def get_daemon_info() -> dict | None:
+    """Return the running daemon's state (pid, port, endpoint), or None"""
+    if not DAEMON_STATE_FILE.exists():
+        return None
+    try:
+        with open(DAEMON_STATE_FILE) as f:
+            info = json.load(f)
+    except Exception:
+        return None
+    if not _pid_alive(info.get("pid", -1)):
+        # Stale state from a daemon that didn't shut down cleanly
+        DAEMON_STATE_FILE.unlink(missing_ok=True)
+        return None
+    return info
+
+
+def get_daemon_endpoint() -> str | None:
+    """CDP endpoint of the running daemon, or None if no daemon is running"""
+    info = get_daemon_info()
+    return info["endpoint"] if info else None
+
+
+def serve(headless: bool = True, idle_timeout: float = DAEMON_IDLE_TIMEOUT_MINUTES):
+    """
+    Run the daemon in the foreground until SIGTERM/SIGINT
+
+    Args:
+        headless: Run the browser in headless mode
+        idle_timeout: Exit after this many minutes with no client tab open (0 = never)
+    """
+    from patchright.sync_api import sync_playwright
+    from browser_utils import BrowserFactory
+
+    port = _free_port()
+    stop = []
+    signal.signal(signal.SIGTERM, lambda *_: stop.append(True))
+    signal.signal(signal.SIGINT, lambda *_: stop.append(True))
+
+    playwright = sync_playwright().start()
+    context = None
+    try:
+        context = BrowserFactory.launch_persistent_context(
+            playwright,
+            headless=headless,
+            extra_args=[f"--remote-debugging-port={port}"],
+        )
+        DAEMON_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        # The endpoint gives full control of the logged-in browser: owner-only
+        fd = os.open(DAEMON_STATE_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.chmod(DAEMON_STATE_FILE, 0o600)  # O_CREAT's mode doesn't apply to an existing file
+        with os.fdopen(fd, "w") as f:
+            json.dump({
+                "pid": os.getpid(),
+                "port": port,
+                "endpoint": f"http://127.0.0.1:{port}",
+                "headless": headless,
+                "idle_timeout": idle_timeout,
+                "started_at": time.time(),
+            }, f, indent=2)
+
+        # Clients attach by opening their own tab, so any tab beyond our
+        # keeper page means a command is running
+        keeper = context.pages[0] if context.pages else context.new_page()
+        last_active = time.time()
+        while not stop:
+            # wait_for_timeout (unlike time.sleep) lets Playwright process page events
+            keeper.wait_for_timeout(500)
+            if len(context.pages) > 1:
+                last_active = time.time()
+            elif idle_timeout and time.time() - last_active > idle_timeout * 60:
+                break
+    finally:
+        DAEMON_STATE_FILE.unlink(missing_ok=True)
+        if context:
+            try:
+                context.close()
+            except Exception:
+                pass
+        try:
+            playwright.stop()
+        except Exception:
+            pass
+
+
+def start(headless: bool = True, timeout: float = 30,
+          idle_timeout: float = DAEMON_IDLE_TIMEOUT_MINUTES) -> dict | None:
+    """
+    Start the daemon in the background and wait for its endpoint
+
+    Args:
+        headless: Run the daemon's browser in headless mode
+        timeout: Seconds to wait for the browser to come up
+        idle_timeout: Minutes without a client before the daemon exits (0 = never)
+
+    Returns:
+        Daemon info dict, or None if it failed to start
+    """
+    info = get_daemon_info()
+    if info:
+        print(f"ℹ️ Browser daemon already running (pid {info['pid']})")
+        return info
+
+    cmd = [sys.executable, str(Path(__file__).resolve()), "serve", "--idle-timeout", str(idle_timeout)]
+    if not headless:
+        cmd.append("--show-browser")
+    subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        info = get_daemon_info()
+        if info:
+            print(f"✅ Browser daemon started (pid {info['pid']}, {info['endpoint']})")
+            return info
+        time.sleep(0.5)
+
+    print("❌ Browser daemon did not start in time")
+    return None
+
+
+def stop() -> bool:
+    """Stop the running daemon. Returns True if one was running."""
+    info = get_daemon_info()
+    if not info:
+        print("ℹ️ Browser daemon is not running")
+        return False
+
+    os.kill(info["pid"], signal.SIGTERM)
+    deadline = time.time() + 10
+    while time.time() < deadline and _pid_alive(info["pid"]):
+        time.sleep(0.2)
+    print(f"✅ Browser daemon stopped (pid {info['pid']})")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Manage the shared NotebookLM browser daemon')
+
+    subparsers = parser.add_subparsers(dest='command', help='Commands')
+
+    start_parser = subparsers.add_parser('start', help='Start the daemon in the background')
+    start_parser.add_argument('--show-browser', action='store_true', help='Run the daemon browser visibly')
+    start_parser.add_argument('--idle-timeout', type=float, default=DAEMON_IDLE_TIMEOUT_MINUTES,
+                              help='Minutes without use before the daemon exits (0 = never)')
+
+    subparsers.add_parser('stop', help='Stop the daemon')
+    subparsers.add_parser('status', help='Show daemon status')
+
+    serve_parser = subparsers.add_parser('serve', help='Run the daemon in the foreground')
+    serve_parser.add_argument('--show-browser', action='store_true', help='Run the daemon browser visibly')
+    serve_parser.add_argument('--idle-timeout', type=float, default=DAEMON_IDLE_TIMEOUT_MINUTES,
+                              help='Minutes without use before the daemon exits (0 = never)')
+
+    args = parser.parse_args()
+
+    if args.command == 'start':
+        return 0 if start(headless=not args.show_browser, idle_timeout=args.idle_timeout) else 1
+
+    elif args.command == 'stop':
+        stop()
+        return 0
+
+    elif args.command == 'status':
+        info = get_daemon_info()
+        print("\n🧭 Browser Daemon Status:")
+        print(f"  Running: {'Yes' if info else 'No'}")
+        if info:
+            print(f"  PID: {info['pid']}")
+            print(f"  Endpoint: {info['endpoint']}")
+            print(f"  Headless: {info.get('headless', True)}")
+            if info.get('idle_timeout'):
+                print(f"  Idle timeout: {info['idle_timeout']:g} minutes")
+            print(f"  Uptime: {(time.time() - info.get('started_at', time.time())) / 60:.1f} minutes")
+        return 0
+
+    elif args.command == 'serve':
+        serve(headless=not args.show_browser, idle_timeout=args.idle_timeout)
+        return 0
+
+    else:
+        parser.print_help()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,14 +3,83 @@ Browser Utilities for NotebookLM Skill
 Handles browser launching, stealth features, and common interactions
 """
 
+from __future__ import annotations
+
 import json
 import time
 import random
 from contextlib import contextmanager
-from typing import Optional, List, Generator
+from typing import Optional, List, Generator, TYPE_CHECKING
+
+# patchright is only imported when a browser is actually started (see
+# browser_session), so scripts importing these helpers don't pay for it on
+# --help, argument errors or cache hits
+if TYPE_CHECKING:
+    from patchright.sync_api import Playwright, BrowserContext, Page
+
+from config import (
+    BROWSER_PROFILE_DIR, STATE_FILE, BROWSER_ARGS, USER_AGENT,
+    BLOCKED_RESOURCE_TYPES, BLOCKED_URL_RE,
+)
+
+
+# Page helper: wait (via MutationObserver) for an actionable element whose text
+# contains one of the given strings, click it, and resolve with its text (or null on timeout)
+WAIT_CLICK_JS = '''
+window.__waitClick = (texts, timeoutMs) => new Promise((resolve) => {
+    const wanted = texts.map(t => t.toLowerCase());
+    const ACTIONABLE = 'button, [role="button"], [role="option"], [role="menuitem"], [role="tab"], mat-chip';
 
-from patchright.sync_api import Playwright, BrowserContext, Page, sync_playwright
-from config import BROWSER_PROFILE_DIR, STATE_FILE, BROWSER_ARGS, USER_AGENT
+    const tryClick = () => {
+        let best = null;
+        let bestLen = Infinity;
+        for (const el of document.querySelectorAll(ACTIONABLE)) {
+            if (!el.getClientRects().length || el.disabled) continue;
+            const text = (el.textContent || '').trim().toLowerCase();
+            if (text.length < bestLen && wanted.some(w => text.includes(w))) {
+                best = el;
+                bestLen = text.length;
+            }
+        }
+        if (!best) return false;
+        best.click();
+        resolve((best.textContent || '').trim());
+        return true;
+    };
+
+    if (tryClick()) return;
+    const observer = new MutationObserver(() => {
+        if (tryClick()) { observer.disconnect(); clearTimeout(timer); }
+    });
+    const timer = setTimeout(() => { observer.disconnect(); resolve(null); }, timeoutMs);
+    observer.observe(document.documentElement, { childList: true, subtree: true, attributes: true });
+});
+'''
+
+
+# Parsed state.json, reused while the file's mtime is unchanged
+_storage_state_cache = {"mtime": None, "state": None}
+
+
+def _load_storage_state() -> Optional[dict]:
+    """
+    Load the saved browser state (cookies) from state.json
+
+    The parsed JSON is memoized per process and re-read only when the file
+    changes, so repeated sessions (batch runs, tests) parse it once.
+
+    Returns:
+        The storage state dict, or None if there is no state file
+    """
+    try:
+        mtime = STATE_FILE.stat().st_mtime
+    except FileNotFoundError:
+        return None
+    if _storage_state_cache["mtime"] != mtime:
+        with open(STATE_FILE, 'r') as f:
+            _storage_state_cache["state"] = json.load(f)
+        _storage_state_cache["mtime"] = mtime
+    return _storage_state_cache["state"]
 
 
 @contextmanager
@@ -18,6 +87,9 @@ def browser_session(headless: bool = True) -> Generator[Page, None, None]:
     """
     Context manager for browser sessions with automatic cleanup.
 
+    Attaches to the browser daemon (browser_daemon.py) when it is running,
+    otherwise launches a fresh persistent context.
+
     Usage:
         with browser_session(headless=True) as page:
             page.goto(url)
@@ -33,14 +105,50 @@ def browser_session(headless: bool = True) -> Generator[Page, None, None]:
     if not auth.is_authenticated():
         raise Exception("Not authenticated. Run: python scripts/run.py auth_manager.py setup")
 
+    # Lazy import: the daemon module is only needed to find a running daemon
+    from browser_daemon import get_daemon_endpoint
+    from patchright.sync_api import sync_playwright
+
     playwright = None
+    browser = None
     context = None
+    page = None
     try:
         playwright = sync_playwright().start()
-        context = BrowserFactory.launch_persistent_context(playwright, headless=headless)
-        page = context.new_page()
+
+        # Attach to the shared browser daemon if one is running (no launch cost)
+        endpoint = get_daemon_endpoint()
+        if endpoint:
+            try:
+                browser = playwright.chromium.connect_over_cdp(endpoint)
+                page = browser.contexts[0].new_page()
+            except Exception as e:
+                print(f"  ⚠️ Could not attach to browser daemon, launching a browser: {e}")
+                # Connected but no page: drop the connection before falling back
+                if browser:
+                    try:
+                        browser.close()
+                    except Exception:
+                        pass
+                browser = None
+
+        if page is None:
+            context = BrowserFactory.launch_persistent_context(playwright, headless=headless)
+            page = context.new_page()
+
+        page.add_init_script(WAIT_CLICK_JS)
         yield page
     finally:
+        if browser:
+            # Leave the daemon's context running; only drop our tab and connection
+            try:
+                page.close()
+            except Exception:
+                pass
+            try:
+                browser.close()
+            except Exception:
+                pass
         if context:
             try:
                 context.close()
@@ -60,7 +168,8 @@ class BrowserFactory:
     def launch_persistent_context(
         playwright: Playwright,
         headless: bool = True,
-        user_data_dir: str = str(BROWSER_PROFILE_DIR)
+        user_data_dir: str = str(BROWSER_PROFILE_DIR),
+        extra_args: Optional[List[str]] = None
     ) -> BrowserContext:
         """
         Launch a persistent browser context with anti-detection features
@@ -74,7 +183,7 @@ class BrowserFactory:
             no_viewport=True,
             ignore_default_args=["--enable-automation"],
             user_agent=USER_AGENT,
-            args=BROWSER_ARGS
+            args=BROWSER_ARGS + (extra_args or [])
         )
 
         # Cookie Workaround for Playwright bug #36139
@@ -86,15 +195,13 @@ class BrowserFactory:
     @staticmethod
     def _inject_cookies(context: BrowserContext):
         """Inject cookies from state.json if available"""
-        if STATE_FILE.exists():
-            try:
-                with open(STATE_FILE, 'r') as f:
-                    state = json.load(f)
-                    if 'cookies' in state and len(state['cookies']) > 0:
-                        context.add_cookies(state['cookies'])
-                        # print(f"  🔧 Injected {len(state['cookies'])} cookies from state.json")
-            except Exception as e:
-                print(f"  ⚠️  Could not load state.json: {e}")
+        try:
+            state = _load_storage_state()
+            if state and state.get('cookies'):
+                context.add_cookies(state['cookies'])
+                # print(f"  🔧 Injected {len(state['cookies'])} cookies from state.json")
+        except Exception as e:
+            print(f"  ⚠️  Could not load state.json: {e}")
 
 
 class StealthUtils:
@@ -148,6 +255,29 @@ class StealthUtils:
         StealthUtils.random_delay(100, 300)
 
 
+def block_resources(page: Page, block_stylesheets: bool = False):
+    """
+    Abort image, font, media and analytics requests on a page
+
+    Only for pages that are read, not looked at: the DOM is unaffected but
+    far less is downloaded before the page settles.
+
+    Args:
+        page: Page to filter
+        block_stylesheets: Also abort stylesheets (breaks layout-dependent scrolling)
+    """
+    blocked = BLOCKED_RESOURCE_TYPES | {'stylesheet'} if block_stylesheets else BLOCKED_RESOURCE_TYPES
+
+    def handler(route):
+        request = route.request
+        if request.resource_type in blocked or BLOCKED_URL_RE.search(request.url):
+            route.abort()
+        else:
+            route.continue_()
+
+    page.route("**/*", handler)
+
+
 def find_and_click(page: Page, selectors: List[str], description: str, timeout: int = 10000) -> bool:
     """
     Try to find and click an element using multiple selectors.
@@ -174,6 +304,48 @@ def find_and_click(page: Page, selectors: List[str], description: str, timeout:
     return False
 
 
+def _is_loose_selector(selector: str) -> bool:
+    """Leaf-text selectors (e.g. 'div:has-text("Sources"):not(:has(*))') match any element showing the text"""
+    return ":not(:has(*))" in selector
+
+
+def find_and_click_any(page: Page, selectors: List[str], description: str, timeout: int = 10000) -> bool:
+    """
+    Click the first visible element matching any of the selectors.
+
+    Unlike find_and_click, the specific selectors are raced in a single wait,
+    so a missing early selector doesn't cost a full timeout before the next is
+    tried. Loose leaf-text selectors are left out of the race (a union matches
+    in DOM order, so they could beat the real control) and are only tried, in
+    order, after it fails.
+
+    Args:
+        page: Playwright page
+        selectors: List of CSS selectors to try
+        description: Human-readable description for logging
+        timeout: Timeout in milliseconds
+
+    Returns:
+        True if clicked successfully, False otherwise
+    """
+    specific = [selector for selector in selectors if not _is_loose_selector(selector)]
+    loose = [selector for selector in selectors if _is_loose_selector(selector)]
+
+    if specific:
+        locator = page.locator(", ".join(f"{selector}:visible" for selector in specific)).first
+        try:
+            locator.wait_for(state="visible", timeout=timeout)
+            StealthUtils.random_delay(200, 500)
+            locator.click()
+            print(f"  ✓ Clicked: {description}")
+            return True
+        except Exception:
+            pass
+
+    # The page has had the full timeout to render by now, so the fallbacks only get a short wait
+    return find_and_click(page, loose, description, timeout=timeout if not specific else 1000)
+
+
 def find_and_fill(page: Page, selectors: List[str], text: str, description: str, timeout: int = 10000) -> bool:
     """
     Try to find an input and fill it using multiple selectors.
@@ -199,3 +371,30 @@ def find_and_fill(page: Page, selectors: List[str], text: str, description: str,
         except Exception:
             continue
     return False
+
+
+def wait_and_click_text(page: Page, texts: List[str], description: str, timeout: int = 8000) -> bool:
+    """
+    Click the first actionable element whose text contains one of texts,
+    waiting in-page for it to appear instead of polling from Python.
+
+    Args:
+        page: Playwright page (from browser_session, which installs the helper)
+        texts: Case-insensitive substrings to look for
+        description: Human-readable description for logging
+        timeout: Timeout in milliseconds
+
+    Returns:
+        True if clicked successfully, False otherwise
+    """
+    try:
+        clicked = page.evaluate(
+            "([texts, t]) => window.__waitClick ? window.__waitClick(texts, t) : null",
+            [texts, timeout],
+        )
+    except Exception:
+        return False
+    if clicked:
+        print(f"  ✓ Clicked: {description}")
+        return True
+    return False
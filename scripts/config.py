@@ -3,6 +3,7 @@ Configuration for NotebookLM Skill
 Centralizes constants, selectors, and paths
 """
 
+import re
 from pathlib import Path
 
 # Paths
@@ -12,6 +13,21 @@ BROWSER_STATE_DIR = DATA_DIR / "browser_state"
 BROWSER_PROFILE_DIR = BROWSER_STATE_DIR / "browser_profile"
 STATE_FILE = BROWSER_STATE_DIR / "state.json"
 AUTH_INFO_FILE = DATA_DIR / "auth_info.json"
+DAEMON_STATE_FILE = DATA_DIR / "browser_daemon.json"
+DEBUG_DIR = DATA_DIR / "debug"  # --debug screenshots and page dumps
+
+# NotebookLM URL / ID patterns
+NOTEBOOKLM_URL_RE = re.compile(r"^https://notebooklm\.google\.com/")
+NOTEBOOK_ID_RE = re.compile(r"/notebook/([a-f0-9-]+)")
+
+# Material icon names and other UI tokens rendered as text lines inside a
+# source row. A JS regex source, matched case-insensitively against whole
+# lines: a row's name is its first non-empty line that isn't one of these
+SOURCE_ROW_NOISE_RE = (
+    r'^(markdown|web|youtube|link|article|description|text_snippet|picture_as_pdf|'
+    r'audio_file|more_vert|more_horiz|check_box|check_box_outline_blank|check|'
+    r'drive_\w*|video_\w*)$'
+)
 
 # NotebookLM Selectors
 QUERY_INPUT_SELECTORS = [
@@ -32,6 +48,13 @@ CHAT_TAB_SELECTORS = [
     '[role="tab"]:has-text("Chat")',
 ]
 
+# "All" tab on the notebook list (user's notebooks, not just featured)
+ALL_TAB_SELECTORS = [
+    'button:has-text("All")',
+    '[role="tab"]:has-text("All")',
+    '.tab:has-text("All")',
+]
+
 # Sources Tab Selectors
 SOURCES_TAB_SELECTORS = [
     'button:has-text("Sources")',
@@ -60,7 +83,13 @@ BROWSER_ARGS = [
 
 USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
 
+# Requests aborted by block_resources() on read-only pages. Stylesheets stay
+# allowed by default: scrolling the sources list depends on CSS layout.
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media'})
+BLOCKED_URL_RE = re.compile(r'googletagmanager|google-analytics|doubleclick|clarity\.ms')
+
 # Timeouts
 LOGIN_TIMEOUT_MINUTES = 10
 QUERY_TIMEOUT_SECONDS = 120
 PAGE_LOAD_TIMEOUT = 30000
+DAEMON_IDLE_TIMEOUT_MINUTES = 30
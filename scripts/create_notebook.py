@@ -11,10 +11,26 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from browser_utils import browser_session, StealthUtils
+from config import NOTEBOOKLM_URL_RE, NOTEBOOK_ID_RE
 from notebook_config import set_last_notebook
 
 
 NOTEBOOKLM_HOME = "https://notebooklm.google.com/"
+NEW_NOTEBOOK_NAME_RE = re.compile(r"new notebook", re.I)
+NOTEBOOK_PAGE_URL_RE = re.compile(r"notebooklm\.google\.com/notebook/[a-f0-9-]+")
+
+# "New notebook" button on the home page
+NEW_NOTEBOOK_SELECTORS = [
+    'button:has-text("New notebook")',
+    'button:has-text("Create")',
+    '[aria-label="Create new notebook"]',
+    '[aria-label="New notebook"]',
+    'button:has(mat-icon:has-text("add"))',
+    '.create-notebook-button',
+    # FAB button
+    'button.mdc-fab',
+    '[data-test-id="create-notebook"]',
+]
 
 
 def create_notebook(name: str = None, headless: bool = True) -> dict:
@@ -36,25 +52,21 @@ def create_notebook(name: str = None, headless: bool = True) -> dict:
             page.goto(NOTEBOOKLM_HOME, wait_until="domcontentloaded")
 
             # Wait for page to load
-            page.wait_for_url(re.compile(r"^https://notebooklm\.google\.com/"), timeout=15000)
+            page.wait_for_url(NOTEBOOKLM_URL_RE, timeout=15000)
             StealthUtils.random_delay(2000, 3000)
 
             # Click "New notebook" button
             print("  🔍 Looking for 'New notebook' button...")
-            new_notebook_selectors = [
-                'button:has-text("New notebook")',
-                'button:has-text("Create")',
-                '[aria-label="Create new notebook"]',
-                '[aria-label="New notebook"]',
-                'button:has(mat-icon:has-text("add"))',
-                '.create-notebook-button',
-                # FAB button
-                'button.mdc-fab',
-                '[data-test-id="create-notebook"]',
-            ]
-
+            # Fast path: accessibility-tree lookup instead of trying selectors one by one
             clicked = False
-            for selector in new_notebook_selectors:
+            try:
+                page.get_by_role("button", name=NEW_NOTEBOOK_NAME_RE).first.click(timeout=5000)
+                print("  ✓ Clicked: New notebook")
+                clicked = True
+            except Exception:
+                pass
+
+            for selector in ([] if clicked else NEW_NOTEBOOK_SELECTORS):
                 try:
                     element = page.wait_for_selector(selector, timeout=5000, state="visible")
                     if element:
@@ -74,14 +86,14 @@ def create_notebook(name: str = None, headless: bool = True) -> dict:
             # Wait for navigation to new notebook
             print("  ⏳ Waiting for new notebook to be created...")
             try:
-                page.wait_for_url(re.compile(r"notebooklm\.google\.com/notebook/[a-f0-9-]+"), timeout=15000)
+                page.wait_for_url(NOTEBOOK_PAGE_URL_RE, timeout=15000)
             except Exception:
                 # Maybe there's a dialog to name the notebook first
                 pass
 
             # Check if we're on a notebook page now
             current_url = page.url
-            notebook_match = re.search(r'/notebook/([a-f0-9-]+)', current_url)
+            notebook_match = NOTEBOOK_ID_RE.search(current_url)
 
             if notebook_match:
                 notebook_id = notebook_match.group(1)
@@ -138,6 +150,8 @@ def create_notebook(name: str = None, headless: bool = True) -> dict:
 
                 # Auto-save as last used notebook
                 set_last_notebook(notebook_id, name or "")
+                from list_notebooks import invalidate_notebooks_cache
+                invalidate_notebooks_cache()
 
                 print(f"  ✅ Created notebook: {notebook_id}")
                 return {
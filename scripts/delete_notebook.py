@@ -10,22 +10,49 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from browser_utils import browser_session, StealthUtils
-from list_notebooks import list_notebooks
+from notebook_config import find_notebook_by_name
+from browser_utils import browser_session, StealthUtils, find_and_click_any
+from config import ALL_TAB_SELECTORS, NOTEBOOKLM_URL_RE, NOTEBOOK_ID_RE
 
 
 NOTEBOOKLM_HOME = "https://notebooklm.google.com/"
-
-
-def find_notebook_by_name(name: str) -> dict | None:
-    """Find notebook by name (fuzzy match)"""
-    result = list_notebooks(headless=True)
-    if result["status"] != "success":
-        return None
-    for nb in result["notebooks"]:
-        if name.lower() in nb.get("name", "").lower():
-            return nb
-    return None
+DELETE_NAME_RE = re.compile(r"^\s*delete\b", re.I)
+
+# Menu (three dots) button on a notebook card
+MENU_BUTTON_SELECTORS = [
+    'button[aria-label="More options"]',
+    'button[aria-label*="menu" i]',
+    'button:has(mat-icon:has-text("more_vert"))',
+    'button:has(mat-icon:has-text("more_horiz"))',
+    '.menu-button',
+    '[data-test-id="notebook-menu"]',
+]
+
+# "Delete" entry in the notebook card menu
+DELETE_MENU_SELECTORS = [
+    'button:has-text("Delete")',
+    '[role="menuitem"]:has-text("Delete")',
+    'mat-menu-item:has-text("Delete")',
+    '[data-test-id="delete-notebook"]',
+]
+
+# Predicate for the confirm button in the delete dialog: returns the first
+# visible, enabled match (or false), so one raf-polled wait covers every candidate.
+# Either label may carry the word, and only as a prefix ("Delete notebook")
+CONFIRM_BUTTON_JS = '''() => {
+    const candidates = document.querySelectorAll(
+        '[role="dialog"] button, mat-dialog-container button, [data-test-id="confirm-delete"]'
+    );
+    for (const btn of candidates) {
+        if (!btn.getClientRects().length || btn.disabled) continue;
+        const labels = [btn.getAttribute('aria-label'), btn.textContent].map(l => (l || '').trim());
+        if (btn.matches('[data-test-id="confirm-delete"]') ||
+            labels.some(l => /^(delete|confirm|yes|ok)\\b/i.test(l))) {
+            return btn;
+        }
+    }
+    return false;
+}'''
 
 
 def delete_notebook(notebook_url: str = None, notebook_id: str = None, notebook_name: str = None,
@@ -49,76 +76,70 @@ def delete_notebook(notebook_url: str = None, notebook_id: str = None, notebook_
     resolved_name = None
 
     if notebook_url:
-        match = re.search(r'/notebook/([a-f0-9-]+)', notebook_url)
+        match = NOTEBOOK_ID_RE.search(notebook_url)
         if match:
             resolved_id = match.group(1)
 
     if not resolved_id and notebook_id:
         resolved_id = notebook_id
 
-    if not resolved_id and notebook_name:
-        print(f"🔍 Looking for notebook: {notebook_name}")
-        nb = find_notebook_by_name(notebook_name)
-        if nb:
+    if not resolved_id and not notebook_name:
+        return {"status": "error", "error": "No notebook specified. Use --notebook-url, --notebook-id, or --notebook-name"}
+
+    if not confirm:
+        if not resolved_id:
+            print(f"🔍 Looking for notebook: {notebook_name}")
+            nb = find_notebook_by_name(notebook_name)
+            if not nb:
+                return {"status": "error", "error": f"No notebook found matching: {notebook_name}"}
             resolved_id = nb["id"]
             resolved_name = nb.get("name", "")
             print(f"📚 Found: {resolved_name}")
-        else:
-            return {"status": "error", "error": f"No notebook found matching: {notebook_name}"}
 
-    if not resolved_id:
-        return {"status": "error", "error": "No notebook specified. Use --notebook-url, --notebook-id, or --notebook-name"}
-
-    if not confirm:
         print(f"⚠️  Would delete notebook: {resolved_name or resolved_id}")
         print(f"   ID: {resolved_id}")
         print(f"   Use --confirm to actually delete")
         return {"status": "preview", "notebook_id": resolved_id, "name": resolved_name}
 
-    print(f"🗑️  Deleting notebook: {resolved_name or resolved_id}")
-
     try:
         with browser_session(headless=headless) as page:
+            if not resolved_id:
+                # Resolve the name on the same browser session used for deletion
+                print(f"🔍 Looking for notebook: {notebook_name}")
+                nb = find_notebook_by_name(notebook_name, page=page)
+                if not nb:
+                    return {"status": "error", "error": f"No notebook found matching: {notebook_name}"}
+                resolved_id = nb["id"]
+                resolved_name = nb.get("name", "")
+                print(f"📚 Found: {resolved_name}")
+
+            print(f"🗑️  Deleting notebook: {resolved_name or resolved_id}")
+
             print("  🌐 Opening NotebookLM...")
             page.goto(NOTEBOOKLM_HOME, wait_until="domcontentloaded")
 
             # Wait for page to load
-            page.wait_for_url(re.compile(r"^https://notebooklm\.google\.com/"), timeout=15000)
-            StealthUtils.random_delay(2000, 3000)
+            page.wait_for_url(NOTEBOOKLM_URL_RE, timeout=15000)
 
-            # Click on "All" tab to see user's notebooks
+            # Click on "All" tab to see user's notebooks; the single raced wait
+            # doubles as the page-ready signal
             print("  🔍 Clicking 'All' tab...")
-            all_tab_selectors = [
-                'button:has-text("All")',
-                '[role="tab"]:has-text("All")',
-            ]
-            for selector in all_tab_selectors:
-                try:
-                    tab = page.wait_for_selector(selector, timeout=5000, state="visible")
-                    if tab:
-                        tab.click()
-                        StealthUtils.random_delay(1500, 2500)
-                        break
-                except Exception:
-                    continue
+            find_and_click_any(page, ALL_TAB_SELECTORS, "'All' tab", timeout=8000)
+            try:
+                page.wait_for_selector('project-button', timeout=8000)
+            except Exception:
+                pass
 
             # Find the notebook card by ID
             print(f"  🔍 Looking for notebook: {resolved_id}")
 
-            # Look for the project-button element containing this notebook
+            # Look for the project-button element containing this notebook in a
+            # single query instead of inspecting every card's button in turn
             notebook_card = None
             try:
-                all_cards = page.query_selector_all('project-button')
-                for card in all_cards:
-                    try:
-                        button = card.query_selector('button[aria-labelledby]')
-                        if button:
-                            aria = button.get_attribute('aria-labelledby') or ""
-                            if resolved_id in aria:
-                                notebook_card = card
-                                break
-                    except Exception:
-                        continue
+                notebook_card = page.query_selector(
+                    f'project-button:has(button[aria-labelledby*="{resolved_id}"])'
+                )
             except Exception:
                 pass
 
@@ -130,17 +151,8 @@ def delete_notebook(notebook_url: str = None, notebook_id: str = None, notebook_
             # Find and click the menu button (three dots) on the notebook card
             print("  🔍 Opening menu...")
             menu_button = None
-            menu_selectors = [
-                'button[aria-label="More options"]',
-                'button[aria-label*="menu" i]',
-                'button:has(mat-icon:has-text("more_vert"))',
-                'button:has(mat-icon:has-text("more_horiz"))',
-                '.menu-button',
-                '[data-test-id="notebook-menu"]',
-            ]
-
             # First try within the notebook card
-            for selector in menu_selectors:
+            for selector in MENU_BUTTON_SELECTORS:
                 try:
                     menu_button = notebook_card.query_selector(selector)
                     if menu_button:
@@ -153,7 +165,7 @@ def delete_notebook(notebook_url: str = None, notebook_id: str = None, notebook_
                 try:
                     notebook_card.hover()
                     StealthUtils.random_delay(500, 1000)
-                    for selector in menu_selectors:
+                    for selector in MENU_BUTTON_SELECTORS:
                         try:
                             menu_button = notebook_card.query_selector(selector)
                             if menu_button:
@@ -172,24 +184,18 @@ def delete_notebook(notebook_url: str = None, notebook_id: str = None, notebook_
 
             # Click "Delete" option in the menu
             print("  🔍 Looking for 'Delete' option...")
-            delete_selectors = [
-                'button:has-text("Delete")',
-                '[role="menuitem"]:has-text("Delete")',
-                'mat-menu-item:has-text("Delete")',
-                '[data-test-id="delete-notebook"]',
-            ]
-
+            # Fast path: menu item by accessible role and name
             deleted = False
-            for selector in delete_selectors:
-                try:
-                    delete_btn = page.wait_for_selector(selector, timeout=3000, state="visible")
-                    if delete_btn:
-                        delete_btn.click()
-                        print("  ✓ Clicked 'Delete'")
-                        deleted = True
-                        break
-                except Exception:
-                    continue
+            try:
+                page.get_by_role("menuitem", name=DELETE_NAME_RE).first.click(timeout=3000)
+                print("  ✓ Clicked 'Delete'")
+                deleted = True
+            except Exception:
+                pass
+
+            if not deleted:
+                # CSS fallbacks, visible matches only, all raced in one wait
+                deleted = find_and_click_any(page, DELETE_MENU_SELECTORS, "'Delete'", timeout=3000)
 
             if not deleted:
                 return {"status": "error", "error": "Could not find 'Delete' option in menu"}
@@ -198,31 +204,24 @@ def delete_notebook(notebook_url: str = None, notebook_id: str = None, notebook_
 
             # Confirm deletion in dialog
             print("  🔍 Confirming deletion...")
-            confirm_selectors = [
-                'button:has-text("Delete")',  # Confirm button in dialog
-                'button:has-text("Confirm")',
-                'button:has-text("Yes")',
-                '[data-test-id="confirm-delete"]',
-                'mat-dialog-actions button:has-text("Delete")',
-            ]
-
             confirmed = False
-            for selector in confirm_selectors:
-                try:
-                    confirm_btn = page.wait_for_selector(selector, timeout=3000, state="visible")
-                    if confirm_btn:
-                        confirm_btn.click()
-                        print("  ✓ Confirmed deletion")
-                        confirmed = True
-                        break
-                except Exception:
-                    continue
+            try:
+                # Resolves on the first animation frame the button is there
+                confirm_btn = page.wait_for_function(CONFIRM_BUTTON_JS, polling="raf", timeout=3000).as_element()
+                if confirm_btn:
+                    confirm_btn.click()
+                    print("  ✓ Confirmed deletion")
+                    confirmed = True
+            except Exception:
+                pass
 
             if not confirmed:
                 # Maybe no confirmation needed
                 print("  ⚠️ No confirmation dialog found, deletion may have completed")
 
             StealthUtils.random_delay(2000, 3000)
+            from list_notebooks import invalidate_notebooks_cache
+            invalidate_notebooks_cache()
 
             print(f"  ✅ Deleted notebook: {resolved_name or resolved_id}")
             return {
@@ -7,15 +7,14 @@ import argparse
 import json
 import sys
 import re
-import time
 from pathlib import Path
 from datetime import datetime
 
 sys.path.insert(0, str(Path(__file__).parent))
 
 from notebook_config import set_last_notebook, find_notebook_url
-from browser_utils import browser_session, StealthUtils
-from config import SOURCES_TAB_SELECTORS
+from browser_utils import browser_session, StealthUtils, find_and_click_any
+from config import SOURCES_TAB_SELECTORS, NOTEBOOKLM_URL_RE, DEBUG_DIR, SOURCE_ROW_NOISE_RE
 
 
 def clean_source_content(raw_content: str, source_name: str) -> str:
@@ -162,7 +161,7 @@ def download_source(
         notebook_id: Notebook UUID
         output_path: Output file path (auto-generated if not provided)
         headless: Run browser in headless mode
-        debug: Save screenshot for debugging
+        debug: Save screenshot and print a traceback on errors
 
     Returns:
         Dict with status and content/file path
@@ -178,109 +177,82 @@ def download_source(
     try:
         with browser_session(headless=headless) as page:
             print("  🌐 Opening notebook...")
-            page.goto(resolved_url, wait_until="domcontentloaded")
+            # Return as soon as the navigation commits; the Sources tab wait
+            # below is the real readiness signal
+            page.goto(resolved_url, wait_until="commit")
 
-            page.wait_for_url(re.compile(r"^https://notebooklm\.google\.com/"), timeout=15000)
-            StealthUtils.random_delay(2000, 3000)
-
-            # Click on Sources tab
+            # Click on Sources tab (all selectors raced in one wait)
             print("  🔍 Clicking Sources tab...")
-            for selector in SOURCES_TAB_SELECTORS:
-                try:
-                    tab = page.wait_for_selector(selector, timeout=5000, state="visible")
-                    if tab:
-                        tab.click()
-                        StealthUtils.random_delay(1500, 2500)
-                        break
-                except Exception:
-                    continue
+            if find_and_click_any(page, SOURCES_TAB_SELECTORS, "Sources tab", timeout=15000):
+                StealthUtils.random_delay(1500, 2500)
+            elif not NOTEBOOKLM_URL_RE.match(page.url):
+                # Only worth checking when the tab never showed: a sign-in redirect
+                return {"status": "error", "error": f"Not on NotebookLM (redirected to {page.url})"}
 
             # Find and click on the source to open it (with retry for slow DOM rendering)
             print(f"  🔍 Looking for source: {source_name}...")
 
-            source_info = None
-            deadline = time.time() + 30
-            while time.time() < deadline:
-                # First scroll to make sure source is visible
-                page.evaluate('''(sourceName) => {
-                    const sourceNameLower = sourceName.toLowerCase();
-                    const checkboxes = document.querySelectorAll('mat-checkbox');
-                    for (const cb of checkboxes) {
+            # Wait in-page (every animation frame) for the row to render and get it
+            # back as a handle; the scroll-and-measure step below then works on that
+            # row only instead of walking every mat-checkbox again
+            try:
+                row = page.wait_for_function('''(sourceNameLower) => {
+                    for (const cb of document.querySelectorAll('mat-checkbox')) {
                         const row = cb.closest('[class*="source"]') || cb.parentElement?.parentElement;
                         if (!row) continue;
-                        const rowText = row.innerText || '';
-                        if (rowText.toLowerCase().indexOf(sourceNameLower) >= 0 &&
-                            rowText.toLowerCase().indexOf('select all') < 0) {
-                            row.scrollIntoView({ block: 'center' });
-                            return true;
-                        }
+                        // Match on textContent (no layout)
+                        const rowLower = (row.textContent || '').toLowerCase();
+                        if (rowLower.includes(sourceNameLower) && !rowLower.includes('select all')) return row;
                     }
                     return false;
-                }''', source_name)
-                StealthUtils.random_delay(500, 800)
-
-                source_info = page.evaluate('''(sourceName) => {
-                const sourceNameLower = sourceName.toLowerCase();
-
-                // Find source by looking at checkbox rows and getting the clickable name element
-                const checkboxes = document.querySelectorAll('mat-checkbox');
-                for (const cb of checkboxes) {
-                    const row = cb.closest('[class*="source"]') || cb.parentElement?.parentElement;
-                    if (!row) continue;
-                    const rowText = row.innerText || '';
-
-                    if (rowText.toLowerCase().indexOf(sourceNameLower) >= 0 &&
-                        rowText.toLowerCase().indexOf('select all') < 0) {
-
-                        // Extract the actual source name
-                        const lines = rowText.split('\\n').map(l => l.trim()).filter(l => l.length > 10);
-                        const nameLines = lines.filter(l => {
-                            const lower = l.toLowerCase();
-                            return lower !== 'markdown' && lower !== 'web' && lower !== 'youtube' &&
-                                   !lower.startsWith('drive_') && !lower.startsWith('video_');
-                        });
-                        const actualName = nameLines[0] || sourceName;
-
-                        // Find the source name text element (usually after the icon, before checkbox)
-                        // Look for spans or divs containing the source name
-                        const allElements = row.querySelectorAll('span, div, a');
-                        for (const el of allElements) {
-                            const text = (el.innerText || '').trim();
-                            // Skip if it's checkbox label, icon text, or too short
-                            if (text.length < 10) continue;
-                            if (el.closest('mat-checkbox')) continue;
-                            if (text === 'markdown' || text === 'web' || text === 'youtube') continue;
-
-                            // This should be the source name - get its position
-                            const rect = el.getBoundingClientRect();
-                            if (rect.width > 50 && rect.height > 10) {
-                                return {
-                                    found: true,
-                                    name: actualName,
-                                    clickTarget: text.substring(0, 50),
-                                    rect: { x: rect.x + rect.width/2, y: rect.y + rect.height/2, width: rect.width, height: rect.height }
-                                };
-                            }
-                        }
-
-                        // Fallback: click the row area but avoid the checkbox (left side)
-                        const rowRect = row.getBoundingClientRect();
-                        // Click in the middle-left area (after icon, before checkbox)
+                }''', arg=source_name.lower(), polling="raf", timeout=30000).as_element()
+            except Exception:
+                row = None
+
+            # Scroll the row into view and measure it in a single round-trip
+            source_info = row.evaluate('''async (row, [sourceName, noise]) => {
+                const noiseRe = new RegExp(noise, 'i');
+                const rowText = row.innerText || '';
+
+                // Bring the row on screen and let layout settle before reading rects
+                row.scrollIntoView({ block: 'center' });
+                await new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r)));
+
+                // Extract the actual source name
+                const actualName = rowText.split('\\n').map(l => l.trim())
+                    .find(l => l && !noiseRe.test(l)) || sourceName;
+
+                // Find the source name text element (usually after the icon, before checkbox)
+                // Look for spans or divs containing the source name
+                const allElements = row.querySelectorAll('span, div, a');
+                for (const el of allElements) {
+                    const text = (el.innerText || '').trim();
+                    // Skip if it's empty, checkbox label or icon text
+                    if (!text || noiseRe.test(text)) continue;
+                    if (el.closest('mat-checkbox')) continue;
+
+                    // This should be the source name - get its position
+                    const rect = el.getBoundingClientRect();
+                    if (rect.width > 50 && rect.height > 10) {
                         return {
                             found: true,
                             name: actualName,
-                            clickTarget: 'row-fallback',
-                            rect: { x: rowRect.x + 150, y: rowRect.y + rowRect.height/2, width: rowRect.width, height: rowRect.height }
+                            clickTarget: text.substring(0, 50),
+                            rect: { x: rect.x + rect.width/2, y: rect.y + rect.height/2, width: rect.width, height: rect.height }
                         };
                     }
                 }
 
-                return { found: false };
-            }''', source_name)
-
-                if source_info and source_info.get('found'):
-                    break
-                time.sleep(2)
+                // Fallback: click the row area but avoid the checkbox (left side)
+                const rowRect = row.getBoundingClientRect();
+                // Click in the middle-left area (after icon, before checkbox)
+                return {
+                    found: true,
+                    name: actualName,
+                    clickTarget: 'row-fallback',
+                    rect: { x: rowRect.x + 150, y: rowRect.y + rowRect.height/2, width: rowRect.width, height: rowRect.height }
+                };
+            }''', [source_name, SOURCE_ROW_NOISE_RE]) if row else None
 
             if not source_info or not source_info.get('found'):
                 print(f"  ❌ Source not found: {source_name}")
@@ -384,28 +356,53 @@ def download_source(
 
                     last_length = current_length
 
-                    # Scroll down in the content panel
-                    page.evaluate('''() => {
+                    # Scroll down in the content panel, noting what it shows beforehand
+                    scroll_state = page.evaluate('''() => {
+                        const measure = (el, selector) => ({
+                            selector,
+                            textLength: (el.innerText || '').length,
+                            scrollHeight: el.scrollHeight,
+                            scrollTop: el.scrollTop,
+                            atBottom: el.scrollTop + el.clientHeight >= el.scrollHeight - 1,
+                        });
+
                         // Find scrollable container and scroll it
-                        const containers = [
-                            document.querySelector('[class*="source-viewer"]'),
-                            document.querySelector('[class*="source-detail"]'),
-                            document.querySelector('[class*="source-content"]'),
-                            document.querySelector('main'),
-                            document.querySelector('mat-sidenav-content'),
+                        const selectors = [
+                            '[class*="source-viewer"]',
+                            '[class*="source-detail"]',
+                            '[class*="source-content"]',
+                            'main',
+                            'mat-sidenav-content',
                         ];
 
-                        for (const container of containers) {
+                        for (const sel of selectors) {
+                            const container = document.querySelector(sel);
                             if (container && container.scrollHeight > container.clientHeight) {
+                                const state = measure(container, sel);
                                 container.scrollTop += 1000;
-                                return true;
+                                state.moved = container.scrollTop !== state.scrollTop;
+                                return state;
                             }
                         }
                         // Fallback to window scroll
+                        const state = measure(document.scrollingElement, null);
                         window.scrollBy(0, 1000);
-                        return false;
+                        state.moved = document.scrollingElement.scrollTop !== state.scrollTop;
+                        return state;
                     }''')
-                    StealthUtils.random_delay(300, 500)
+
+                    # At the bottom, or the scroll didn't move: nothing new will render,
+                    # so don't wait. Otherwise continue as soon as the viewer renders more
+                    # text (or grows) rather than sleeping a fixed interval
+                    if scroll_state['moved'] and not scroll_state['atBottom']:
+                        try:
+                            page.wait_for_function('''(state) => {
+                                const el = state.selector ? document.querySelector(state.selector) : document.scrollingElement;
+                                return !!el && ((el.innerText || '').length !== state.textLength
+                                                || el.scrollHeight > state.scrollHeight);
+                            }''', arg=scroll_state, timeout=500)
+                        except Exception:
+                            pass
                 else:
                     break
 
@@ -540,11 +537,10 @@ def download_source(
                     print(f"  📊 After cleaning: {len(content)} chars")
 
             if debug:
-                debug_dir = Path(__file__).parent.parent / "data" / "debug"
-                debug_dir.mkdir(parents=True, exist_ok=True)
+                DEBUG_DIR.mkdir(parents=True, exist_ok=True)
                 try:
-                    page.screenshot(path=str(debug_dir / "download_source.png"))
-                    print(f"  📸 Screenshot saved to: {debug_dir / 'download_source.png'}")
+                    page.screenshot(path=str(DEBUG_DIR / "download_source.png"))
+                    print(f"  📸 Screenshot saved to: {DEBUG_DIR / 'download_source.png'}")
                 except Exception as e:
                     print(f"  ⚠️ Could not save screenshot: {e}")
 
@@ -602,8 +598,9 @@ def download_source(
 
     except Exception as e:
         print(f"  ❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        if debug:
+            import traceback
+            traceback.print_exc()
         return {"status": "error", "error": str(e)}
 
 
@@ -624,7 +621,7 @@ def main():
     # Options
     parser.add_argument('--show-browser', action='store_true', help='Show browser for debugging')
     parser.add_argument('--json', action='store_true', help='Output as JSON')
-    parser.add_argument('--debug', action='store_true', help='Save screenshot for debugging')
+    parser.add_argument('--debug', action='store_true', help='Save screenshot and print tracebacks for debugging')
 
     args = parser.parse_args()
 
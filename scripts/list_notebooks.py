@@ -5,26 +5,187 @@ Fetches the actual notebooks from NotebookLM's UI
 """
 
 import argparse
+import contextlib
 import json
 import sys
-import re
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from browser_utils import browser_session, StealthUtils
+from browser_utils import browser_session, find_and_click_any
+from config import NOTEBOOKLM_URL_RE, ALL_TAB_SELECTORS, DEBUG_DIR
+from notebook_config import get_cached_notebooks, set_cached_notebooks
 
 
 NOTEBOOKLM_HOME = "https://notebooklm.google.com/"
 
+# Extract notebooks from the first selector that matches, deduped by id
+EXTRACT_NOTEBOOKS_JS = '''(selectors) => {
+    // User notebooks: every project card that isn't (inside) a featured card.
+    // Filtering with closest() avoids the slow :not(.featured-project-card *) selector.
+    let elements = Array.from(document.querySelectorAll('project-button .project-button-card'))
+        .filter(card => !card.closest('.featured-project-card'));
+    let matched = elements.length ? 'project-button .project-button-card (non-featured)' : null;
+
+    for (const selector of (matched ? [] : selectors)) {
+        try {
+            elements = document.querySelectorAll(selector);
+        } catch (e) {
+            continue;
+        }
+        if (elements.length) {
+            matched = selector;
+            break;
+        }
+    }
+
+    const notebooks = [];
+    const seen = new Set();
+    for (const el of elements) {
+        // Extract ID from aria-labelledby (e.g., "project-UUID-title project-UUID-emoji")
+        let notebookId = null;
+        const button = el.querySelector('button[aria-labelledby]');
+        const labelledBy = button ? button.getAttribute('aria-labelledby') : null;
+        let m = labelledBy ? labelledBy.match(/project-([a-f0-9-]+)-/) : null;
+        if (m) notebookId = m[1];
+
+        // Also try from element IDs
+        if (!notebookId) {
+            const titleEl = el.querySelector('[id*="project-"][id*="-title"]');
+            m = titleEl ? (titleEl.id || '').match(/project-([a-f0-9-]+)-title/) : null;
+            if (m) notebookId = m[1];
+        }
+
+        // Fall back to the notebook link's href (plain <a href="/notebook/UUID"> cards)
+        if (!notebookId) {
+            const link = el.matches('a[href]') ? el : el.querySelector('a[href*="/notebook/"]');
+            m = link ? (link.getAttribute('href') || '').match(/\\/notebook\\/([a-f0-9-]+)/) : null;
+            if (m) notebookId = m[1];
+        }
+
+        if (!notebookId || seen.has(notebookId)) continue;
+        seen.add(notebookId);
+
+        const info = {
+            id: notebookId,
+            url: 'https://notebooklm.google.com/notebook/' + notebookId,
+        };
+
+        // Get name from .project-button-title, falling back to inner text
+        const titleEl = el.querySelector('.project-button-title');
+        let name = titleEl ? titleEl.innerText.trim() : '';
+        if (!name) {
+            const lines = (el.innerText || '').split('\\n').map(l => l.trim()).filter(l => l);
+            // Skip emoji and menu icon
+            name = lines.find(l => l.length > 2 && !l.startsWith('more')) || '';
+        }
+        info.name = name || ('Notebook ' + notebookId.slice(0, 8) + '...');
+
+        // Get date and source count from subtitle
+        for (const part of el.querySelectorAll('.project-button-subtitle-part')) {
+            const text = part.innerText.trim();
+            if (text.toLowerCase().includes('source')) {
+                info.sources = text;
+            } else if (text && !info.last_modified) {
+                info.last_modified = text;
+            }
+        }
+
+        notebooks.push(info);
+    }
+
+    return { selector: matched, count: elements.length, notebooks };
+}'''
+
+# Notebook cards on the home page, most specific first
+NOTEBOOK_CARD_SELECTORS = [
+    # NotebookLM Angular component patterns (from actual page structure)
+    'project-button .project-button-card.blue-background',  # User notebooks have blue-background
+    '.my-projects-container project-button',
+    # Fallback patterns
+    '[data-notebook-id]',
+    '.notebook-card',
+    '.notebook-item',
+    'a[href*="/notebook/"]',
+]
+
+
+def _list_notebooks_on_page(page, debug: bool = False) -> dict:
+    """Open the NotebookLM home page on an existing page and extract notebooks"""
+    print("  🌐 Opening NotebookLM...")
+    page.goto(NOTEBOOKLM_HOME, wait_until="domcontentloaded")
 
-def list_notebooks(headless: bool = True, output_format: str = "table", debug: bool = False) -> dict:
+    # Wait for page to load
+    page.wait_for_url(NOTEBOOKLM_URL_RE, timeout=15000)
+
+    # Click on "All" tab to see user's notebooks (not just featured); all
+    # selectors are raced in one wait, which also covers the page settling
+    print("  🔍 Clicking 'All' tab...")
+    find_and_click_any(page, ALL_TAB_SELECTORS, "'All' tab", timeout=8000)
+
+    # Wait for notebook cards to render instead of a fixed delay
+    try:
+        page.wait_for_selector('project-button, a[href*="/notebook/"]', timeout=8000)
+    except Exception:
+        pass
+
+    print("  🔍 Looking for notebooks...")
+
+    # One round-trip: scan the non-featured project cards, falling back to the
+    # first NOTEBOOK_CARD_SELECTORS entry that matches, and extract every
+    # notebook deduped by ID (from aria-labelledby, a title element ID, or the link href)
+    found = page.evaluate(EXTRACT_NOTEBOOKS_JS, NOTEBOOK_CARD_SELECTORS)
+    notebooks = found["notebooks"]  # already deduped by ID during collection
+    if found["selector"]:
+        print(f"  ✓ Found {found['count']} notebooks using: {found['selector']}")
+
+    if not notebooks:
+        print("  ⚠️ No notebooks found with selectors. Checking page content...")
+
+        if debug:
+            # Save screenshot and HTML for debugging
+            DEBUG_DIR.mkdir(parents=True, exist_ok=True)
+            try:
+                page.screenshot(path=str(DEBUG_DIR / "notebooklm_home.png"))
+                print(f"  📸 Screenshot saved to: {DEBUG_DIR / 'notebooklm_home.png'}")
+            except Exception as e:
+                print(f"  ⚠️ Could not save screenshot: {e}")
+            try:
+                html = page.content()
+                with open(DEBUG_DIR / "notebooklm_home.html", "w") as f:
+                    f.write(html)
+                print(f"  📄 HTML saved to: {DEBUG_DIR / 'notebooklm_home.html'}")
+            except Exception as e:
+                print(f"  ⚠️ Could not save HTML: {e}")
+
+        # Try to get any visible text for debugging
+        try:
+            page_text = page.inner_text('body')
+            if "Create new notebook" in page_text or "New notebook" in page_text:
+                print("  ℹ️ NotebookLM loaded but no notebooks exist yet")
+                return {"status": "success", "notebooks": [], "count": 0}
+        except Exception:
+            pass
+        return {"status": "error", "error": "Could not find notebooks on page"}
+
+    print(f"  ✅ Found {len(notebooks)} notebooks")
+
+    return {
+        "status": "success",
+        "notebooks": notebooks,
+        "count": len(notebooks)
+    }
+
+
+def list_notebooks(headless: bool = True, output_format: str = "table", debug: bool = False, page=None) -> dict:
     """
     List all notebooks from NotebookLM
 
     Args:
         headless: Run browser in headless mode
         output_format: Output format (table, json)
+        debug: Save screenshot/HTML and print a traceback on errors
+        page: Existing Playwright page to reuse instead of launching a browser
 
     Returns:
         Dict with status and notebooks list
@@ -32,215 +193,59 @@ def list_notebooks(headless: bool = True, output_format: str = "table", debug: b
     print("📚 Fetching notebooks from NotebookLM...")
 
     try:
+        if page is not None:
+            return _list_notebooks_on_page(page, debug)
         with browser_session(headless=headless) as page:
-            print("  🌐 Opening NotebookLM...")
-            page.goto(NOTEBOOKLM_HOME, wait_until="domcontentloaded")
-
-            # Wait for page to load
-            page.wait_for_url(re.compile(r"^https://notebooklm\.google\.com/"), timeout=15000)
-            StealthUtils.random_delay(2000, 3000)
-
-            # Click on "All" tab to see user's notebooks (not just featured)
-            print("  🔍 Clicking 'All' tab...")
-            all_tab_selectors = [
-                'button:has-text("All")',
-                '[role="tab"]:has-text("All")',
-                'div[role="tab"]:has-text("All")',
-                '.tab:has-text("All")',
-            ]
-            for selector in all_tab_selectors:
-                try:
-                    tab = page.wait_for_selector(selector, timeout=5000, state="visible")
-                    if tab:
-                        tab.click()
-                        print("  ✓ Clicked 'All' tab")
-                        StealthUtils.random_delay(1500, 2500)
-                        break
-                except Exception:
-                    continue
-
-            print("  🔍 Looking for notebooks...")
-
-            notebooks = []
-
-            # Try multiple selectors for notebook items
-            notebook_selectors = [
-                # NotebookLM Angular component patterns (from actual page structure)
-                'project-button:not(.featured-project-card *) .project-button-card:not(.featured-project-card)',
-                'project-button .project-button-card.blue-background',  # User notebooks have blue-background
-                '.my-projects-container project-button',
-                # Fallback patterns
-                '[data-notebook-id]',
-                '.notebook-card',
-                '.notebook-item',
-                'a[href*="/notebook/"]',
-            ]
-
-            notebook_elements = []
-
-            for selector in notebook_selectors:
-                try:
-                    elements = page.query_selector_all(selector)
-                    if elements:
-                        notebook_elements = elements
-                        print(f"  ✓ Found {len(elements)} notebooks using: {selector}")
-                        break
-                except Exception:
-                    continue
-
-            # If no specific selectors work, try finding all notebook links
-            if not notebook_elements:
-                try:
-                    # Find all links to notebooks
-                    all_links = page.query_selector_all('a[href*="/notebook/"]')
-                    # Deduplicate by href
-                    seen_urls = set()
-                    for link in all_links:
-                        href = link.get_attribute('href')
-                        if href and href not in seen_urls:
-                            seen_urls.add(href)
-                            notebook_elements.append(link)
-                    if notebook_elements:
-                        print(f"  ✓ Found {len(notebook_elements)} notebook links")
-                except Exception:
-                    pass
-
-            if not notebook_elements:
-                print("  ⚠️ No notebooks found with selectors. Checking page content...")
-
-                if debug:
-                    # Save screenshot and HTML for debugging
-                    debug_dir = Path(__file__).parent.parent / "data" / "debug"
-                    debug_dir.mkdir(parents=True, exist_ok=True)
-                    try:
-                        page.screenshot(path=str(debug_dir / "notebooklm_home.png"))
-                        print(f"  📸 Screenshot saved to: {debug_dir / 'notebooklm_home.png'}")
-                    except Exception as e:
-                        print(f"  ⚠️ Could not save screenshot: {e}")
-                    try:
-                        html = page.content()
-                        with open(debug_dir / "notebooklm_home.html", "w") as f:
-                            f.write(html)
-                        print(f"  📄 HTML saved to: {debug_dir / 'notebooklm_home.html'}")
-                    except Exception as e:
-                        print(f"  ⚠️ Could not save HTML: {e}")
-
-                # Try to get any visible text for debugging
-                try:
-                    page_text = page.inner_text('body')
-                    if "Create new notebook" in page_text or "New notebook" in page_text:
-                        print("  ℹ️ NotebookLM loaded but no notebooks exist yet")
-                        return {"status": "success", "notebooks": [], "count": 0}
-                except Exception:
-                    pass
-                return {"status": "error", "error": "Could not find notebooks on page"}
-
-            # Extract notebook info
-            for element in notebook_elements:
-                try:
-                    notebook_info = {}
-
-                    # Extract ID from aria-labelledby attribute (e.g., "project-UUID-title")
-                    # or from button's aria-labelledby
-                    notebook_id = None
-                    try:
-                        button = element.query_selector('button[aria-labelledby]')
-                        if button:
-                            aria_labelledby = button.get_attribute('aria-labelledby')
-                            if aria_labelledby:
-                                # Extract UUID from "project-UUID-title project-UUID-emoji"
-                                match = re.search(r'project-([a-f0-9-]+)-', aria_labelledby)
-                                if match:
-                                    notebook_id = match.group(1)
-                    except Exception:
-                        pass
-
-                    # Also try from element IDs
-                    if not notebook_id:
-                        try:
-                            title_el = element.query_selector('[id*="project-"][id*="-title"]')
-                            if title_el:
-                                el_id = title_el.get_attribute('id')
-                                match = re.search(r'project-([a-f0-9-]+)-title', el_id)
-                                if match:
-                                    notebook_id = match.group(1)
-                        except Exception:
-                            pass
-
-                    if notebook_id:
-                        notebook_info['id'] = notebook_id
-                        notebook_info['url'] = f"https://notebooklm.google.com/notebook/{notebook_id}"
-
-                    # Get name from .project-button-title
-                    name = None
-                    try:
-                        title_el = element.query_selector('.project-button-title')
-                        if title_el:
-                            name = title_el.inner_text().strip()
-                    except Exception:
-                        pass
-
-                    # Fallback to inner text
-                    if not name:
-                        try:
-                            text = element.inner_text().strip()
-                            lines = [l.strip() for l in text.split('\n') if l.strip()]
-                            # Skip emoji and get first real text
-                            for line in lines:
-                                if len(line) > 2 and not line.startswith('more'):  # Skip emoji and menu icon
-                                    name = line
-                                    break
-                        except Exception:
-                            pass
-
-                    if name:
-                        notebook_info['name'] = name
-                    elif notebook_id:
-                        notebook_info['name'] = f"Notebook {notebook_id[:8]}..."
-
-                    # Get date and source count from subtitle
-                    try:
-                        subtitle_parts = element.query_selector_all('.project-button-subtitle-part')
-                        for part in subtitle_parts:
-                            text = part.inner_text().strip()
-                            if 'source' in text.lower():
-                                notebook_info['sources'] = text
-                            elif text and not notebook_info.get('last_modified'):
-                                notebook_info['last_modified'] = text
-                    except Exception:
-                        pass
-
-                    if notebook_info.get('id'):
-                        notebooks.append(notebook_info)
-
-                except Exception as e:
-                    print(f"  ⚠️ Error parsing notebook: {e}")
-                    continue
-
-            # Deduplicate by URL
-            seen_urls = set()
-            unique_notebooks = []
-            for nb in notebooks:
-                url = nb.get('url')
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
-                    unique_notebooks.append(nb)
-
-            print(f"  ✅ Found {len(unique_notebooks)} notebooks")
-
-            return {
-                "status": "success",
-                "notebooks": unique_notebooks,
-                "count": len(unique_notebooks)
-            }
+            return _list_notebooks_on_page(page, debug)
 
     except Exception as e:
         print(f"  ❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        if debug:
+            import traceback
+            traceback.print_exc()
         return {"status": "error", "error": str(e)}
 
 
+def cached_list_notebooks(ttl_seconds: int = 300, refresh: bool = False, headless: bool = True,
+                          page=None, name: str = None) -> dict:
+    """
+    List notebooks, reusing a cached result (in data/config.json) younger than ttl_seconds
+
+    Used for name lookups so that repeated runs don't launch a browser
+    just to resolve a notebook name.
+
+    Args:
+        ttl_seconds: Maximum cache age in seconds
+        refresh: Ignore the cache and fetch a fresh list
+        headless: Run browser in headless mode (on cache miss)
+        page: Existing Playwright page to reuse on cache miss
+        name: Name being looked up; a cached list with no notebook whose
+              name contains it counts as a miss and is refreshed
+
+    Returns:
+        Dict with status and notebooks list (same shape as list_notebooks)
+    """
+    notebooks = None if refresh else get_cached_notebooks(ttl_seconds)
+    if notebooks is not None:
+        name_lower = name.lower() if name else None
+        if name_lower is None or any(name_lower in nb.get("name", "").lower() for nb in notebooks):
+            print(f"📚 Using cached notebook list ({len(notebooks)} notebooks)")
+            return {"status": "success", "notebooks": notebooks, "count": len(notebooks)}
+
+    result = list_notebooks(headless=headless, output_format="json", page=page)
+    if result["status"] == "success":
+        try:
+            set_cached_notebooks(result["notebooks"])
+        except Exception:
+            pass
+    return result
+
+
+def invalidate_notebooks_cache():
+    """Drop the cached notebook list (after creating or deleting a notebook)"""
+    set_cached_notebooks(None)
+
+
 def main():
     parser = argparse.ArgumentParser(description='List notebooks from NotebookLM')
 
@@ -250,11 +255,13 @@ def main():
 
     args = parser.parse_args()
 
-    result = list_notebooks(
-        headless=not args.show_browser,
-        output_format="json" if args.json else "table",
-        debug=args.debug
-    )
+    # In --json mode keep stdout clean for the JSON payload; progress goes to stderr
+    with contextlib.redirect_stdout(sys.stderr) if args.json else contextlib.nullcontext():
+        result = list_notebooks(
+            headless=not args.show_browser,
+            output_format="json" if args.json else "table",
+            debug=args.debug
+        )
 
     if result["status"] == "success":
         notebooks = result["notebooks"]
@@ -279,7 +286,7 @@ def main():
                 print("\n📚 No notebooks found. Create one at https://notebooklm.google.com/")
         return 0
     else:
-        print(f"\n❌ Failed: {result.get('error', 'Unknown error')}")
+        print(f"\n❌ Failed: {result.get('error', 'Unknown error')}", file=sys.stderr if args.json else sys.stdout)
         return 1
 
 
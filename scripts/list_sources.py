@@ -4,17 +4,328 @@ List all sources in a NotebookLM notebook via browser automation
 """
 
 import argparse
+import contextlib
 import json
 import sys
-import re
-import time
 from pathlib import Path
 
+# Optional: faster JSON encoding for --json output
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 sys.path.insert(0, str(Path(__file__).parent))
 
-from notebook_config import set_last_notebook, find_notebook_url
-from browser_utils import browser_session, StealthUtils, find_and_click
-from config import SOURCES_TAB_SELECTORS
+# browser_utils (and with it patchright) is imported inside the functions that
+# drive the browser, so --help and argument errors don't pay for it
+from notebook_config import (
+    set_last_notebook, find_notebook_url, find_cached_notebook_url,
+    get_cached_sources, set_cached_sources,
+)
+from config import SOURCES_TAB_SELECTORS, DEBUG_DIR, SOURCE_ROW_NOISE_RE
+
+
+# Candidate scroll containers for the sources list, most specific first
+SCROLL_CONTAINER_SELECTORS = (
+    'mat-sidenav-content',
+    '[class*="source-list"]',
+    '[class*="sources-container"]',
+)
+
+# Upper bound on scroll steps for one sources list
+MAX_SCROLL_STEPS = 30
+
+# Default age (seconds) up to which a cached source list is returned without a browser
+SOURCES_CACHE_MAX_AGE = 60
+
+# Installed once per page as an init script.
+# window.__collectAndScrollSources: extract source rows not seen yet, then scroll the
+# list (straight to the bottom unless it turns out to be virtualized) and wait until
+# it stops mutating (400ms of quiet, capped at 3s). Returns
+# {sources, atBottom, mutated}.
+# window.__collectAllSources: run that step until the list is exhausted and return
+# every source, so the whole scroll loop is a single evaluate. If Python exposed
+# window.__nblmOnSources, each new batch is also passed to it as it is found.
+# Rows already extracted (and names already returned) are remembered in-page. After
+# the first full scan a MutationObserver queues checkboxes as they are added, so
+# each later step only looks at rows that newly appeared (plus any still unreadable).
+SOURCES_HELPERS_JS = '''
+window.__seenSourceRows = new WeakSet();
+window.__seenSources = new Set();
+window.__pendingSourceBoxes = null;
+
+window.__sourcesVirtual = false;
+
+function watchSourceBoxes() {
+    window.__pendingSourceBoxes = [];
+    new MutationObserver((mutations) => {
+        for (const m of mutations) {
+            for (const node of m.addedNodes) {
+                if (node.nodeType !== 1) continue;
+                if (node.matches('mat-checkbox')) window.__pendingSourceBoxes.push(node);
+                else window.__pendingSourceBoxes.push(...node.querySelectorAll('mat-checkbox'));
+            }
+            // Rows being removed while scrolling means a virtualized list, which
+            // only renders what is on screen and can't be skipped through
+            for (const node of m.removedNodes) {
+                if (node.nodeType === 1 && (node.matches('mat-checkbox') || node.querySelector('mat-checkbox'))) {
+                    window.__sourcesVirtual = true;
+                }
+            }
+        }
+    }).observe(document.body, { childList: true, subtree: true });
+}
+
+// Icon names and UI tokens that show up as text lines inside a source row
+const NOISE_LINE_RE = new RegExp(''' + json.dumps(SOURCE_ROW_NOISE_RE) + ''', 'i');
+
+window.__collectAndScrollSources = async (containerSelectors) => {
+    const sources = [];
+
+    // Each source has a mat-checkbox: scan them all once, then only those the
+    // observer has seen added since the last step
+    let checkboxes;
+    if (window.__pendingSourceBoxes === null) {
+        checkboxes = document.querySelectorAll('mat-checkbox');
+        watchSourceBoxes();
+    } else {
+        checkboxes = window.__pendingSourceBoxes;
+        window.__pendingSourceBoxes = [];
+    }
+    // Rows not readable yet (no text rendered) are looked at again next step
+    const retry = [];
+
+    for (const checkbox of checkboxes) {
+        if (window.__seenSourceRows.has(checkbox)) continue;
+
+        // Get the parent row to find the source name
+        const row = checkbox.closest('[class*="source"]') ||
+                   checkbox.parentElement?.parentElement ||
+                   checkbox.parentElement;
+        if (!row) {
+            retry.push(checkbox);
+            continue;
+        }
+
+        const rowText = row.innerText || row.textContent || '';
+        const rowLower = rowText.toLowerCase();
+
+        // Skip "Select all sources" row
+        if (rowLower.indexOf('select all') >= 0) {
+            window.__seenSourceRows.add(checkbox);
+            continue;
+        }
+
+        // Get checkbox state - check multiple ways
+        const input = checkbox.querySelector('input[type="checkbox"]');
+        const isChecked = input ? input.checked :
+                        checkbox.classList.contains('mat-mdc-checkbox-checked') ||
+                        checkbox.classList.contains('mat-checkbox-checked');
+
+        // Extract source name: first non-empty line that isn't an icon name
+        let name = null;
+        for (const raw of rowText.split('\\n')) {
+            const line = raw.trim();
+            if (!line || NOISE_LINE_RE.test(line)) continue;
+            name = line;
+            break;
+        }
+
+        if (name === null) {
+            retry.push(checkbox);
+            continue;
+        }
+        window.__seenSourceRows.add(checkbox);
+
+        const key = name.toLowerCase();
+        if (window.__seenSources.has(key)) continue;
+        window.__seenSources.add(key);
+
+        // Determine source type from icons in the row
+        let sourceType = 'Document';
+        if (rowLower.indexOf('youtube') >= 0) sourceType = 'YouTube';
+        else if (rowLower.indexOf('web') >= 0 && rowLower.indexOf('web ') < 0) sourceType = 'Website';
+        else if (rowLower.indexOf('drive_pdf') >= 0) sourceType = 'PDF';
+
+        // Compact [name, type, enabled] rows keep the CDP payload small;
+        // Python turns them back into dicts
+        sources.push([name, sourceType, isChecked]);
+    }
+    window.__pendingSourceBoxes.push(...retry.filter(cb => cb.isConnected));
+
+    // Scroll down, then let the newly loaded rows render. The container is
+    // looked up once and reused until Angular replaces it.
+    let target = window.__sourcesScrollContainer;
+    if (!target || !target.isConnected) {
+        target = null;
+        for (const sel of containerSelectors) {
+            const container = document.querySelector(sel);
+            if (container && container.scrollHeight > container.clientHeight) {
+                target = container;
+                break;
+            }
+        }
+        window.__sourcesScrollContainer = target;
+    }
+
+    const el = target || document.scrollingElement || document.documentElement;
+    const startTop = el.scrollTop;
+    const jump = !window.__sourcesVirtual;
+
+    let mutated = false;
+    await new Promise((resolve) => {
+        let quiet = setTimeout(done, 400);
+        const cap = setTimeout(done, 3000);
+        const observer = new MutationObserver(() => {
+            mutated = true;
+            clearTimeout(quiet);
+            quiet = setTimeout(done, 400);
+        });
+        function done() {
+            observer.disconnect();
+            clearTimeout(quiet);
+            clearTimeout(cap);
+            resolve();
+        }
+        observer.observe(target || document.body, { childList: true, subtree: true });
+
+        // Lazily appended lists: jump straight to the bottom so each step loads
+        // the next page. Virtualized lists: step by ~a screenful (the floor covers
+        // clientHeight reading 0 mid re-render) so no row is skipped.
+        if (jump) el.scrollTop = el.scrollHeight;
+        else el.scrollTop += Math.max(200, el.clientHeight * 0.9);
+    });
+
+    if (jump && window.__sourcesVirtual) {
+        // The jump showed the list is virtualized: go back and walk it instead
+        el.scrollTop = startTop;
+        return { sources, atBottom: false, mutated: true };
+    }
+
+    // Report whether the list can't scroll any further, so the caller can stop
+    // as soon as a pass at the bottom turns up nothing new
+    const atBottom = el.scrollTop + el.clientHeight + 1 >= el.scrollHeight;
+
+    return { sources, atBottom, mutated };
+};
+
+// Whole scroll-and-collect loop in one call: stop on the first empty step at
+// the bottom of the list or whose scroll didn't change the DOM at all, or after
+// 3 empty steps if neither is ever reported
+window.__collectAllSources = async (containerSelectors, maxSteps) => {
+    const all = [];
+    let emptySteps = 0;
+    for (let i = 0; i < maxSteps; i++) {
+        const step = await window.__collectAndScrollSources(containerSelectors);
+        if (step.sources.length) {
+            all.push(...step.sources);
+            emptySteps = 0;
+            // Hand each batch to Python as soon as it is found (--stream)
+            if (window.__nblmOnSources) await window.__nblmOnSources(step.sources);
+        } else if (step.atBottom || !step.mutated || ++emptySteps >= 3) {
+            break;
+        }
+    }
+    return all;
+};
+'''
+
+
+def _source_dicts(rows: list) -> list:
+    """Expand the extractor's compact [name, type, enabled] rows into source dicts"""
+    return [{"name": name, "type": source_type, "enabled": enabled} for name, source_type, enabled in rows]
+
+
+def _list_sources_on_page(page, resolved_url: str, debug: bool = False) -> tuple:
+    """
+    Open a notebook on an existing page and collect its sources
+
+    The page must already have SOURCES_HELPERS_JS registered as an init script.
+    Only page work happens here; pass the returned (result, extracted, screenshot)
+    to _record_sources once the browser is closed.
+    """
+    from browser_utils import find_and_click_any
+
+    print(f"📚 Listing sources for notebook: {resolved_url}")
+    print("  🌐 Opening notebook...")
+    page.goto(resolved_url, wait_until="domcontentloaded")
+
+    # goto already returns at DOMContentLoaded on the final URL; the Sources
+    # tab becoming visible is the real readiness signal (waited for below)
+    print("  🔍 Clicking Sources tab...")
+    find_and_click_any(page, SOURCES_TAB_SELECTORS, "Sources tab", timeout=10000)
+
+    # Wait for at least one source row to render (sources may be slow to load).
+    # Checked every animation frame, so it resolves on the frame Angular renders
+    # the first row rather than on the next fixed polling tick
+    print("  ⏳ Waiting for sources to render...")
+    try:
+        count = page.wait_for_function('''() => {
+            const checkboxes = document.querySelectorAll('mat-checkbox');
+            let sourceCount = 0;
+            for (const cb of checkboxes) {
+                const row = cb.closest('[class*="source"]') || cb.parentElement?.parentElement;
+                if (!row) continue;
+                const rowText = (row.textContent || '').toLowerCase();
+                if (rowText.indexOf('select all') < 0) sourceCount++;
+            }
+            return sourceCount || false;
+        }''', polling="raf", timeout=30000).json_value()
+        print(f"  ✓ Sources rendered ({count} found)")
+    except Exception:
+        print("  ⚠️ No sources rendered within 30s")
+
+    print("  🔍 Looking for sources...")
+
+    # Scroll-and-collect entirely in-page: one round-trip for the whole list
+    print("  📜 Scrolling to load all sources...")
+    extracted = False
+    try:
+        all_sources = _source_dicts(page.evaluate(
+            "([sel, steps]) => window.__collectAllSources(sel, steps)",
+            [SCROLL_CONTAINER_SELECTORS, MAX_SCROLL_STEPS],
+        ))
+        extracted = True
+    except Exception as e:
+        print(f"  ⚠️ Extraction error: {e}")
+        all_sources = []
+
+    screenshot = None
+    if debug:
+        try:
+            screenshot = page.screenshot(type="jpeg", quality=70)
+        except Exception as e:
+            print(f"  ⚠️ Could not take screenshot: {e}")
+
+    print(f"  ✅ Found {len(all_sources)} sources")
+
+    result = {
+        "status": "success",
+        "sources": all_sources,
+        "count": len(all_sources),
+        "notebook_url": resolved_url
+    }
+    return result, extracted, screenshot
+
+
+def _record_sources(result: dict, extracted: bool, screenshot: bytes | None):
+    """Write the debug screenshot and config updates for a listing, after the browser is closed"""
+    if screenshot is not None:
+        try:
+            DEBUG_DIR.mkdir(parents=True, exist_ok=True)
+            (DEBUG_DIR / "list_sources.jpg").write_bytes(screenshot)
+            print(f"  📸 Screenshot saved to: {DEBUG_DIR / 'list_sources.jpg'}")
+        except Exception as e:
+            print(f"  ⚠️ Could not save screenshot: {e}")
+
+    # Save as last used notebook
+    set_last_notebook(result["notebook_url"])
+    if extracted:
+        try:
+            set_cached_sources(result["notebook_url"], result["sources"])
+        except Exception:
+            pass
 
 
 def list_sources(
@@ -23,234 +334,235 @@ def list_sources(
     notebook_id: str = None,
     headless: bool = True,
     output_format: str = "table",
-    debug: bool = False
+    debug: bool = False,
+    refresh: bool = False,
+    max_age: float = SOURCES_CACHE_MAX_AGE,
+    use_cache: bool = False,
+    on_sources=None
 ) -> dict:
     """
     List all sources in a NotebookLM notebook
+
+    refresh bypasses the cached notebook list when resolving notebook_name.
+    With use_cache, a source list fetched less than max_age seconds ago is
+    returned straight from the cache, without a browser. Off by default: the
+    cache can't see changes made in the web UI within that window.
+    on_sources, if given, is called with each batch of newly found sources
+    while the list is still being scrolled (not for cached results).
     """
-    # Resolve notebook URL first (before browser)
-    try:
-        resolved_url = find_notebook_url(notebook_name, notebook_id, notebook_url)
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+    # A name lookup may need the browser (cache miss), so it runs inside the
+    # session below; URL/ID/last-used resolve without one
+    needs_lookup = bool(notebook_name) and not (notebook_url or notebook_id)
+    if not needs_lookup:
+        try:
+            resolved_url = find_notebook_url(notebook_name, notebook_id, notebook_url)
+        except Exception as e:
+            return {"status": "error", "error": str(e)}
+
+    if use_cache and max_age > 0 and not (needs_lookup and refresh):
+        cache_url = find_cached_notebook_url(notebook_name) if needs_lookup else resolved_url
+        cached = get_cached_sources(cache_url, max_age) if cache_url else None
+        if cached is not None:
+            print(f"📚 Using cached sources for notebook: {cache_url} ({len(cached)} sources)")
+            set_last_notebook(cache_url)
+            return {
+                "status": "success",
+                "sources": cached,
+                "count": len(cached),
+                "notebook_url": cache_url,
+                "cached": True
+            }
 
-    print(f"📚 Listing sources for notebook: {resolved_url}")
+    from browser_utils import browser_session, block_resources
 
     try:
         with browser_session(headless=headless) as page:
-            print("  🌐 Opening notebook...")
-            page.goto(resolved_url, wait_until="domcontentloaded")
-
-            # Wait for NotebookLM to load
-            page.wait_for_url(re.compile(r"^https://notebooklm\.google\.com/"), timeout=15000)
-            StealthUtils.random_delay(2000, 3000)
-
-            # Click on Sources tab
-            print("  🔍 Clicking Sources tab...")
-            find_and_click(page, SOURCES_TAB_SELECTORS, "Sources tab", timeout=5000)
-            StealthUtils.random_delay(1500, 2500)
-
-            # Poll for at least 1 mat-checkbox to render (sources may be slow to load)
-            print("  ⏳ Waiting for sources to render...")
-            deadline = time.time() + 30
-            while time.time() < deadline:
-                count = page.evaluate('''() => {
-                    const checkboxes = document.querySelectorAll('mat-checkbox');
-                    let sourceCount = 0;
-                    for (const cb of checkboxes) {
-                        const row = cb.closest('[class*="source"]') || cb.parentElement?.parentElement;
-                        if (!row) continue;
-                        const rowText = (row.innerText || '').toLowerCase();
-                        if (rowText.indexOf('select all') < 0) sourceCount++;
-                    }
-                    return sourceCount;
-                }''')
-                if count > 0:
-                    print(f"  ✓ Sources rendered ({count} found)")
-                    break
-                time.sleep(2)
-
-            print("  🔍 Looking for sources...")
-
-            # Scroll-and-collect: keep scrolling until no new sources found
-            all_sources = []
-            seen_names = set()
-            max_scroll_attempts = 30
-            scroll_attempt = 0
-            last_count = 0
-            no_new_sources_count = 0
-
-            print("  📜 Scrolling to load all sources...")
-
-            while scroll_attempt < max_scroll_attempts:
-                scroll_attempt += 1
-
-                # Extract sources using DOM query (more reliable than text parsing)
+            if needs_lookup:
                 try:
-                    sources_data = page.evaluate('''() => {
-                        const sources = [];
-
-                        // Find all mat-checkbox elements (each source has one)
-                        const checkboxes = document.querySelectorAll('mat-checkbox');
-
-                        for (const checkbox of checkboxes) {
-                            // Get the parent row to find the source name
-                            const row = checkbox.closest('[class*="source"]') ||
-                                       checkbox.parentElement?.parentElement ||
-                                       checkbox.parentElement;
-                            if (!row) continue;
-
-                            const rowText = row.innerText || row.textContent || '';
-
-                            // Skip "Select all sources" row
-                            if (rowText.toLowerCase().indexOf('select all') >= 0) continue;
-
-                            // Get checkbox state - check multiple ways
-                            const input = checkbox.querySelector('input[type="checkbox"]');
-                            const isChecked = input ? input.checked :
-                                            checkbox.classList.contains('mat-mdc-checkbox-checked') ||
-                                            checkbox.classList.contains('mat-checkbox-checked');
-
-                            // Extract source name (first non-empty line with length > 10)
-                            const lines = rowText.split('\\n').map(l => l.trim()).filter(l => l.length > 10);
-                            // Filter out icon names and other noise
-                            const nameLines = lines.filter(l => {
-                                const lower = l.toLowerCase();
-                                return lower !== 'markdown' &&
-                                       lower !== 'web' &&
-                                       lower !== 'youtube' &&
-                                       !lower.startsWith('drive_') &&
-                                       !lower.startsWith('video_');
-                            });
-
-                            if (nameLines.length === 0) continue;
-                            const name = nameLines[0];
-
-                            // Determine source type from icons in the row
-                            let sourceType = 'Document';
-                            const rowLower = rowText.toLowerCase();
-                            if (rowLower.indexOf('youtube') >= 0) sourceType = 'YouTube';
-                            else if (rowLower.indexOf('web') >= 0 && rowLower.indexOf('web ') < 0) sourceType = 'Website';
-                            else if (rowLower.indexOf('drive_pdf') >= 0) sourceType = 'PDF';
-
-                            sources.push({
-                                name: name,
-                                type: sourceType,
-                                enabled: isChecked
-                            });
-                        }
-
-                        return sources;
-                    }''')
-
-                    if sources_data:
-                        for src in sources_data:
-                            name = src.get('name', '')
-                            name_lower = name.lower() if name else ''
-                            if name and name_lower not in seen_names:
-                                seen_names.add(name_lower)
-                                all_sources.append(src)
-
+                    resolved_url = find_notebook_url(notebook_name, notebook_id, notebook_url, page=page,
+                                                     refresh=refresh)
                 except Exception as e:
-                    print(f"  ⚠️ Extraction error: {e}")
+                    return {"status": "error", "error": str(e)}
 
-                current_count = len(all_sources)
+            page.add_init_script(SOURCES_HELPERS_JS)
+            block_resources(page)
+            if on_sources:
+                page.expose_function("__nblmOnSources", lambda rows: on_sources(_source_dicts(rows)))
+            listing = _list_sources_on_page(page, resolved_url, debug)
 
-                if current_count == last_count:
-                    no_new_sources_count += 1
-                    if no_new_sources_count >= 3:
-                        break
-                else:
-                    no_new_sources_count = 0
-                    if scroll_attempt == 1 or current_count % 10 == 0:
-                        print(f"  ✓ Found {current_count} sources so far...")
+        # Disk writes happen after the browser has been released
+        _record_sources(*listing)
+        return listing[0]
 
-                last_count = current_count
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        return {"status": "error", "error": str(e)}
 
-                # Scroll down
-                try:
-                    page.evaluate('''() => {
-                        const containers = [
-                            document.querySelector('mat-sidenav-content'),
-                            document.querySelector('[class*="source-list"]'),
-                            document.querySelector('[class*="sources-container"]'),
-                        ];
-                        for (const container of containers) {
-                            if (container && container.scrollHeight > container.clientHeight) {
-                                container.scrollTop += 500;
-                                return true;
-                            }
-                        }
-                        window.scrollBy(0, 500);
-                        return false;
-                    }''')
-                    StealthUtils.random_delay(600, 1000)
-                except Exception:
-                    break
-
-            if debug:
-                debug_dir = Path(__file__).parent.parent / "data" / "debug"
-                debug_dir.mkdir(parents=True, exist_ok=True)
-                try:
-                    page.screenshot(path=str(debug_dir / "list_sources.png"))
-                    print(f"  📸 Screenshot saved to: {debug_dir / 'list_sources.png'}")
-                except Exception as e:
-                    print(f"  ⚠️ Could not save screenshot: {e}")
 
-            print(f"  ✅ Found {len(all_sources)} sources")
+def list_sources_batch(notebook_urls: list, headless: bool = True, debug: bool = False) -> list:
+    """
+    List sources for several notebooks in one browser session
 
-            # Save as last used notebook
-            set_last_notebook(resolved_url)
+    The browser is launched (or attached to) once and the same page is reused
+    for every notebook, so only the first notebook pays the startup cost.
 
-            return {
-                "status": "success",
-                "sources": all_sources,
-                "count": len(all_sources),
-                "notebook_url": resolved_url
-            }
+    Args:
+        notebook_urls: Notebook URLs or IDs
+        headless: Run browser in headless mode
+        debug: Save a screenshot per notebook
 
+    Returns:
+        One result dict per notebook, in the same order
+    """
+    resolved = []
+    for value in notebook_urls:
+        try:
+            if value.startswith("http"):
+                resolved.append(find_notebook_url(None, None, value))
+            else:
+                resolved.append(find_notebook_url(None, value, None))
+        except Exception as e:
+            resolved.append(e)
+
+    from browser_utils import browser_session, block_resources
+
+    results = []
+    pending = []
+    try:
+        with browser_session(headless=headless) as page:
+            page.add_init_script(SOURCES_HELPERS_JS)
+            block_resources(page)
+            for url in resolved:
+                if isinstance(url, Exception):
+                    results.append({"status": "error", "error": str(url)})
+                    continue
+                try:
+                    listing = _list_sources_on_page(page, url, debug)
+                    results.append(listing[0])
+                    pending.append(listing)
+                except Exception as e:
+                    print(f"  ❌ Error: {e}")
+                    results.append({"status": "error", "error": str(e), "notebook_url": url})
     except Exception as e:
         print(f"  ❌ Error: {e}")
-        return {"status": "error", "error": str(e)}
+        while len(results) < len(resolved):
+            results.append({"status": "error", "error": str(e)})
+
+    # Disk writes happen after the browser has been released
+    for listing in pending:
+        _record_sources(*listing)
+
+    return results
+
+
+def _dumps(obj) -> str:
+    """Pretty-print JSON, using orjson's C encoder when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _print_sources(result: dict):
+    """Print one notebook's sources as a table"""
+    sources = result["sources"]
+    if sources:
+        enabled_count = sum(1 for s in sources if s.get('enabled', True))
+        disabled_count = len(sources) - enabled_count
+        # Build the whole table and write it once instead of several prints per source
+        lines = [f"\n📄 Sources ({len(sources)} total, {enabled_count} on, {disabled_count} off):\n\n"]
+        for i, src in enumerate(sources, 1):
+            status = "✅" if src.get('enabled', True) else "⬜"
+            lines.append(f"  {i}. {status} {src.get('name', 'Unnamed')}\n")
+            if src.get('type') and src['type'] != 'Unknown':
+                lines.append(f"        Type: {src['type']}\n")
+            lines.append("\n")
+        sys.stdout.write("".join(lines))
+    else:
+        print("\n📄 No sources found in this notebook.")
+
+
+def _stream_printer(as_json: bool):
+    """Callback for list_sources(on_sources=...) that prints each batch right away"""
+    out = sys.stdout
+    numbered = [0]
+
+    def emit(batch):
+        lines = []
+        for src in batch:
+            if as_json:
+                # NDJSON: one source object per line
+                lines.append(json.dumps(src, ensure_ascii=False) + "\n")
+            else:
+                numbered[0] += 1
+                status = "✅" if src.get('enabled', True) else "⬜"
+                lines.append(f"  {numbered[0]}. {status} {src.get('name', 'Unnamed')}\n")
+        out.write("".join(lines))
+        out.flush()
+
+    return emit
 
 
 def main():
     parser = argparse.ArgumentParser(description='List sources in a NotebookLM notebook')
-    parser.add_argument('--notebook-url', help='Direct notebook URL')
-    parser.add_argument('--notebook-id', help='Notebook UUID')
+    parser.add_argument('--notebook-url', action='append', help='Direct notebook URL (repeat to list several notebooks)')
+    parser.add_argument('--notebook-id', action='append', help='Notebook UUID (repeat to list several notebooks)')
     parser.add_argument('--notebook-name', help='Notebook name (fuzzy match)')
     parser.add_argument('--show-browser', action='store_true', help='Show browser for debugging')
     parser.add_argument('--json', action='store_true', help='Output as JSON')
     parser.add_argument('--debug', action='store_true', help='Save screenshot for debugging')
+    parser.add_argument('--refresh', action='store_true', help='Ignore the cached notebook list when resolving --notebook-name')
+    parser.add_argument('--cached', action='store_true',
+                        help='Reuse a recently fetched source list instead of opening the notebook')
+    parser.add_argument('--max-age', type=float, default=SOURCES_CACHE_MAX_AGE,
+                        help=f'With --cached, oldest list to reuse in seconds (default: {SOURCES_CACHE_MAX_AGE})')
+    parser.add_argument('--stream', action='store_true',
+                        help='Print sources as they are found (with --json: one JSON object per line)')
 
     args = parser.parse_args()
 
-    result = list_sources(
-        notebook_url=args.notebook_url,
-        notebook_name=args.notebook_name,
-        notebook_id=args.notebook_id,
-        headless=not args.show_browser,
-        output_format="json" if args.json else "table",
-        debug=args.debug
-    )
+    targets = (args.notebook_url or []) + (args.notebook_id or [])
+    if len(targets) > 1:
+        results = list_sources_batch(targets, headless=not args.show_browser, debug=args.debug)
+        if args.json:
+            print(_dumps(results))
+        else:
+            for result in results:
+                if result["status"] == "success":
+                    print(f"\n📚 {result['notebook_url']}")
+                    _print_sources(result)
+                else:
+                    print(f"\n❌ Failed: {result.get('error', 'Unknown error')}")
+        return 0 if all(r["status"] == "success" for r in results) else 1
+
+    emit = _stream_printer(args.json) if args.stream else None
+
+    # When streaming JSON, stdout carries only the NDJSON lines; progress goes to stderr
+    with contextlib.redirect_stdout(sys.stderr) if args.stream and args.json else contextlib.nullcontext():
+        result = list_sources(
+            notebook_url=args.notebook_url[0] if args.notebook_url else None,
+            notebook_name=args.notebook_name,
+            notebook_id=args.notebook_id[0] if args.notebook_id else None,
+            headless=not args.show_browser,
+            output_format="json" if args.json else "table",
+            debug=args.debug,
+            refresh=args.refresh,
+            max_age=args.max_age,
+            use_cache=args.cached,
+            on_sources=emit
+        )
+
+    if emit and result["status"] == "success":
+        if result.get("cached"):
+            emit(result["sources"])
+        if not args.json:
+            print(f"\n📄 {result['count']} sources")
+        return 0
 
     if result["status"] == "success":
-        sources = result["sources"]
         if args.json:
-            print(json.dumps(result, indent=2, ensure_ascii=False))
+            print(_dumps(result))
         else:
-            if sources:
-                enabled_count = sum(1 for s in sources if s.get('enabled', True))
-                disabled_count = len(sources) - enabled_count
-                print(f"\n📄 Sources ({len(sources)} total, {enabled_count} on, {disabled_count} off):\n")
-                for i, src in enumerate(sources, 1):
-                    status = "✅" if src.get('enabled', True) else "⬜"
-                    print(f"  {i}. {status} {src.get('name', 'Unnamed')}")
-                    if src.get('type') and src['type'] != 'Unknown':
-                        print(f"        Type: {src['type']}")
-                    print()
-            else:
-                print("\n📄 No sources found in this notebook.")
+            _print_sources(result)
         return 0
     else:
         print(f"\n❌ Failed: {result.get('error', 'Unknown error')}")
@@ -4,30 +4,82 @@ Auto-remember last used notebook.
 No CLI commands needed - just internal get/set functions.
 """
 
+import copy
 import json
+import os
+import time
 from pathlib import Path
 
+from config import NOTEBOOK_ID_RE
+
 
 CONFIG_FILE = Path(__file__).parent.parent / "data" / "config.json"
 
 
+# Parsed config.json, reused while the file's mtime is unchanged
+_config_cache = {"mtime": None, "config": None}
+
+# Notebook name (lowercased) -> URL resolved earlier in this process
+_resolved_names = {}
+
+
 def _load_config() -> dict:
-    """Load config from disk"""
-    CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
-    if CONFIG_FILE.exists():
-        try:
-            with open(CONFIG_FILE) as f:
-                return json.load(f)
-        except Exception:
-            pass
-    return {}
+    """
+    Load config from disk (memoized until the file changes)
+
+    Returns a copy: callers mutate it before saving, and that must not leak
+    into the memoized dict other callers get.
+    """
+    try:
+        mtime = CONFIG_FILE.stat().st_mtime
+    except FileNotFoundError:
+        return {}
+    if _config_cache["mtime"] == mtime:
+        return copy.deepcopy(_config_cache["config"])
+    try:
+        with open(CONFIG_FILE, encoding="utf-8") as f:
+            config = json.load(f)
+    except Exception:
+        return {}
+    _config_cache.update(mtime=mtime, config=config)
+    return copy.deepcopy(config)
 
 
 def _save_config(config: dict):
-    """Save config to disk"""
+    """Save config to disk (atomically, via a temp file and os.replace)"""
     CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(config, f, indent=2)
+    tmp_file = CONFIG_FILE.with_suffix(".json.tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(config, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_file, CONFIG_FILE)
+    # Keep a copy of the saved dict as the memoized one so the next load doesn't re-parse it
+    _config_cache.update(mtime=CONFIG_FILE.stat().st_mtime, config=copy.deepcopy(config))
+
+
+def update_config(**fields) -> dict:
+    """
+    Update several config fields with a single write (none if nothing changed).
+
+    Args:
+        **fields: Fields to set; a value of None removes the field
+
+    Returns:
+        The updated config
+    """
+    config = _load_config()
+    changed = False
+    for key, value in fields.items():
+        if value is None:
+            if key in config:
+                del config[key]
+                changed = True
+        elif config.get(key) != value:
+            config[key] = value
+            changed = True
+    # Reusing the same notebook is the common case: don't rewrite an identical file
+    if changed:
+        _save_config(config)
+    return config
 
 
 def get_last_notebook() -> dict | None:
@@ -43,14 +95,113 @@ def get_last_notebook() -> dict | None:
 
 
 def set_last_notebook(notebook_id: str, name: str = ""):
-    """Remember the last used notebook (called automatically after successful operations)"""
+    """
+    Remember the last used notebook (called automatically after successful operations)
+
+    Args:
+        notebook_id: Notebook UUID (a full notebook URL is also accepted)
+        name: Notebook name, if known
+    """
+    match = NOTEBOOK_ID_RE.search(notebook_id)
+    if match:
+        notebook_id = match.group(1)
+    update_config(last_notebook_id=notebook_id, last_notebook_name=name)
+
+
+def get_cached_notebooks(ttl_seconds: int) -> list | None:
+    """Return the cached notebook list if it is younger than ttl_seconds"""
     config = _load_config()
-    config["last_notebook_id"] = notebook_id
-    config["last_notebook_name"] = name
-    _save_config(config)
+    notebooks = config.get("notebooks")
+    if notebooks is None or time.time() - config.get("notebooks_mtime", 0) >= ttl_seconds:
+        return None
+    return notebooks
+
+
+def set_cached_notebooks(notebooks: list | None):
+    """Store (or with None, drop) the cached notebook list"""
+    # Names resolved against the old list may no longer be right
+    _resolved_names.clear()
+    if notebooks is None:
+        update_config(notebooks=None, notebooks_mtime=None)
+    else:
+        update_config(notebooks=notebooks, notebooks_mtime=time.time())
+
+
+def _notebook_key(notebook_url: str) -> str:
+    """Notebook UUID from a URL (or the value itself if it isn't a notebook URL)"""
+    match = NOTEBOOK_ID_RE.search(notebook_url)
+    return match.group(1) if match else notebook_url
+
+
+def get_cached_sources(notebook_url: str, max_age: float) -> list | None:
+    """Return a notebook's cached source list if it is younger than max_age seconds"""
+    entry = _load_config().get("sources", {}).get(_notebook_key(notebook_url))
+    if entry is None or time.time() - entry.get("fetched", 0) >= max_age:
+        return None
+    return entry["sources"]
+
+
+def set_cached_sources(notebook_url: str, sources: list | None):
+    """Store (or with None, drop) a notebook's cached source list"""
+    cache = _load_config().get("sources", {})
+    key = _notebook_key(notebook_url)
+    if sources is None:
+        if key not in cache:
+            return
+        del cache[key]
+    else:
+        cache[key] = {"fetched": time.time(), "sources": sources}
+    update_config(sources=cache or None)
+
+
+def _match_notebook(notebooks: list, notebook_name: str) -> dict | None:
+    """Notebook whose name matches exactly, else partially (case-insensitive)"""
+    notebook_name_lower = notebook_name.lower()
+    # One pass: an exact match wins immediately, otherwise the first partial match
+    partial = None
+    for nb in notebooks:
+        name = nb.get("name", "").lower()
+        if name == notebook_name_lower:
+            return nb
+        if partial is None and notebook_name_lower in name:
+            partial = nb
+    return partial
+
+
+def _match_notebook_url(notebooks: list, notebook_name: str) -> str | None:
+    """URL of the notebook matching notebook_name (see _match_notebook)"""
+    nb = _match_notebook(notebooks, notebook_name)
+    return nb["url"] if nb else None
+
+
+def find_notebook_by_name(name: str, page=None) -> dict | None:
+    """
+    Find a notebook by name (fuzzy match) using the cached notebook list
 
+    Args:
+        name: Notebook name (exact match preferred, else partial)
+        page: Open Playwright page to reuse if the list has to be fetched
 
-def find_notebook_url(notebook_name: str = None, notebook_id: str = None, notebook_url: str = None) -> str:
+    Returns:
+        Notebook dict (id, name, url, ...) or None if not found
+    """
+    # Lazy import to avoid circular dependency
+    from list_notebooks import cached_list_notebooks
+
+    result = cached_list_notebooks(page=page, name=name)
+    if result["status"] != "success":
+        return None
+    return _match_notebook(result["notebooks"], name)
+
+
+def find_cached_notebook_url(notebook_name: str, ttl_seconds: int = 300) -> str | None:
+    """Resolve a notebook name from the cached notebook list only (never opens a browser)"""
+    notebooks = get_cached_notebooks(ttl_seconds)
+    return _match_notebook_url(notebooks, notebook_name) if notebooks else None
+
+
+def find_notebook_url(notebook_name: str = None, notebook_id: str = None, notebook_url: str = None,
+                      page=None, refresh: bool = False) -> str:
     """
     Resolve notebook URL from name, ID, or URL.
     Priority: url > id > name > last used
@@ -59,6 +210,8 @@ def find_notebook_url(notebook_name: str = None, notebook_id: str = None, notebo
         notebook_name: Notebook name (fuzzy match)
         notebook_id: Notebook UUID
         notebook_url: Direct notebook URL
+        page: Open Playwright page to reuse if the name isn't in the notebook cache
+        refresh: Ignore the cached notebook list and fetch a fresh one
 
     Returns:
         Notebook URL string
@@ -73,25 +226,22 @@ def find_notebook_url(notebook_name: str = None, notebook_id: str = None, notebo
         return f"https://notebooklm.google.com/notebook/{notebook_id}"
 
     if notebook_name:
+        # Repeated lookups in one process (scripts, test runs) skip even the cache read
+        key = notebook_name.lower()
+        if not refresh and key in _resolved_names:
+            return _resolved_names[key]
+
         # Lazy import to avoid circular dependency
-        from list_notebooks import list_notebooks
+        from list_notebooks import cached_list_notebooks
 
-        result = list_notebooks(headless=True, output_format="json")
+        result = cached_list_notebooks(refresh=refresh, name=notebook_name, page=page)
         if result["status"] != "success":
             raise Exception(f"Failed to list notebooks: {result.get('error')}")
 
-        notebooks = result["notebooks"]
-        notebook_name_lower = notebook_name.lower()
-
-        # Try exact match first
-        for nb in notebooks:
-            if nb.get("name", "").lower() == notebook_name_lower:
-                return nb["url"]
-
-        # Try partial match
-        for nb in notebooks:
-            if notebook_name_lower in nb.get("name", "").lower():
-                return nb["url"]
+        url = _match_notebook_url(result["notebooks"], notebook_name)
+        if url is not None:
+            _resolved_names[key] = url
+            return url
 
         raise Exception(f"Notebook not found: {notebook_name}")
 
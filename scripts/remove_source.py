@@ -5,16 +5,287 @@ Remove source from a NotebookLM notebook
 
 import argparse
 import json
-import sys
 import re
-import time
+import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from notebook_config import set_last_notebook, find_notebook_url
-from browser_utils import browser_session, StealthUtils
-from config import SOURCES_TAB_SELECTORS
+# browser_utils (and with it patchright) is imported inside remove_source(),
+# so --help and argument errors don't pay for it
+from notebook_config import set_last_notebook, find_notebook_url, set_cached_sources
+from config import SOURCES_TAB_SELECTORS, NOTEBOOKLM_URL_RE, DEBUG_DIR, SOURCE_ROW_NOISE_RE
+
+
+# Accessible names of the menu item and dialog button that delete a source.
+# Looked up with get_by_role (accessibility tree, hidden elements skipped)
+# rather than :has-text CSS selectors
+DELETE_ITEM_NAME_RE = re.compile(r"^\s*(delete|remove)\b", re.I)
+CONFIRM_NAME_RE = re.compile(r"^\s*(delete|remove|confirm|yes|ok)\s*$", re.I)
+
+# Delete confirmation dialog, and a test-id fallback for its confirm button
+# (the button is otherwise found by role and name inside the dialog)
+CONFIRM_DIALOG_SELECTOR = '[role="dialog"], mat-dialog-container'
+CONFIRM_TEST_ID_SELECTOR = '[data-test-id="confirm-delete"]'
+
+
+# In-page helpers, registered once per page with add_init_script so each call
+# below only sends a short function call instead of the whole matcher
+REMOVE_HELPERS_JS = '''
+(() => {
+    const noiseRe = new RegExp(''' + json.dumps(SOURCE_ROW_NOISE_RE) + ''', 'i');
+
+    // Row of the source whose text contains nameLower, or false.
+    // Only the source rows are searched, by textContent (no layout)
+    window.__nblmFindSourceRow = (nameLower) => {
+        for (const checkbox of document.querySelectorAll('mat-checkbox')) {
+            const row = checkbox.closest('[class*="source"]') || checkbox.parentElement?.parentElement;
+            const rowLower = (row?.textContent || '').toLowerCase();
+            if (!rowLower.includes(nameLower) || rowLower.includes('select all')) continue;
+
+            // The whole row: hovering it reveals its menu button
+            return checkbox.closest('[class*="source-row"]') ||
+                   checkbox.closest('[class*="list-item"]') || row;
+        }
+        return false;
+    };
+
+    // Display name (innerText only for this row) and bounding box of a row
+    window.__nblmSourceRowInfo = (row, nameLower) => {
+        const lines = (row.innerText || '').split('\\n').map(l => l.trim())
+            .filter(l => l && !noiseRe.test(l));
+        const name = lines.find(l => l.toLowerCase().includes(nameLower)) || lines[0];
+        const rect = row.getBoundingClientRect();
+        return {
+            name: name,
+            rowRect: { x: rect.x, y: rect.y, width: rect.width, height: rect.height }
+        };
+    };
+
+    // Click the "more" menu button within a row
+    window.__nblmClickRowMenu = (row) => {
+        const moreBtn = row.querySelector('button[aria-label*="More"], button[aria-label*="more"]') ||
+                       row.querySelector('button:has(mat-icon)') ||
+                       row.querySelector('mat-icon[fonticon="more_vert"]')?.closest('button') ||
+                       row.querySelector('mat-icon')?.closest('button');
+
+        if (moreBtn) {
+            moreBtn.click();
+            return { clicked: true, method: 'direct' };
+        }
+
+        // Fallback: try to find any clickable icon in the row
+        const icons = row.querySelectorAll('mat-icon, button');
+        for (const icon of icons) {
+            const iconText = icon.textContent || '';
+            if (iconText.indexOf('more') >= 0 || icon.getAttribute('aria-label')?.toLowerCase().indexOf('more') >= 0) {
+                icon.click();
+                return { clicked: true, method: 'icon' };
+            }
+        }
+
+        return { clicked: false };
+    };
+})();
+'''
+
+
+def _save_screenshot(filename: str, data: bytes):
+    """Write a debug screenshot taken during the browser session"""
+    try:
+        DEBUG_DIR.mkdir(parents=True, exist_ok=True)
+        (DEBUG_DIR / filename).write_bytes(data)
+        print(f"  📸 Screenshot saved to: {DEBUG_DIR / filename}")
+    except Exception as e:
+        print(f"  ⚠️ Could not save screenshot: {e}")
+
+
+def _delete_option(page):
+    """Locator for the Delete/Remove entry of an open menu (menu item or plain button)"""
+    return page.get_by_role("menuitem", name=DELETE_ITEM_NAME_RE).or_(
+        page.get_by_role("button", name=DELETE_ITEM_NAME_RE)
+    ).first
+
+
+def _open_sources_panel(page, resolved_url: str):
+    """Open a notebook on page and switch to its Sources tab"""
+    from browser_utils import find_and_click_any
+
+    page.add_init_script(REMOVE_HELPERS_JS)
+    print("  🌐 Opening notebook...")
+    # Return as soon as the navigation commits; the Sources tab wait below is
+    # the real readiness signal. No fixed sleeps between steps: each one waits
+    # for the DOM state it needs (tab, row, menu, dialog)
+    page.goto(resolved_url, wait_until="commit")
+
+    # Click on Sources tab (all selectors raced in one wait)
+    print("  🔍 Clicking Sources tab...")
+    if not find_and_click_any(page, SOURCES_TAB_SELECTORS, "Sources tab", timeout=15000):
+        # Only worth checking when the tab never showed: a sign-in redirect
+        if not NOTEBOOKLM_URL_RE.match(page.url):
+            raise Exception(f"Not on NotebookLM (redirected to {page.url}); re-run auth_manager.py setup")
+
+
+def _remove_on_page(page, source_name: str, debug: bool = False, confirm: bool = True) -> tuple:
+    """
+    Remove one source from the notebook open on page (Sources tab showing)
+
+    Returns:
+        (result dict, screenshot) where screenshot is a (filename, PNG bytes)
+        pair to write once the browser is closed, or None
+    """
+    from browser_utils import StealthUtils
+
+    # Find the source by name in the sources list (with retry for slow DOM rendering)
+    print(f"  🔍 Looking for source: {source_name}...")
+
+    # Wait in-page for the row to render: the matcher runs every animation
+    # frame and resolves on the first frame the row exists, instead of a
+    # Python loop re-evaluating it every 2s. The row itself comes back as a
+    # handle, so later steps work on it without searching the list again
+    try:
+        row = page.wait_for_function(
+            "(n) => window.__nblmFindSourceRow(n)",
+            arg=source_name.lower(), polling="raf", timeout=30000
+        ).as_element()
+    except Exception:
+        row = None
+
+    # Display name and position, read from the matched row in one call
+    found_source = row.evaluate(
+        "(row, n) => window.__nblmSourceRowInfo(row, n)", source_name.lower()
+    ) if row else None
+
+    if not found_source:
+        print(f"  ❌ Source not found: {source_name}")
+        return {"status": "error", "error": f"Source not found: {source_name}"}, None
+
+    actual_source_name = found_source.get("name") or source_name
+    print(f"  ✓ Found source: {actual_source_name[:60]}...")
+
+    # Look for delete option - hover the source row found above and click its menu button
+    print("  🔍 Looking for delete option...")
+
+    delete_clicked = False
+
+    try:
+        # Step 1: Hover over the right side of the row to reveal the menu button
+        # (the lookup already returned the row's position: no second DOM pass)
+        row_rect = found_source["rowRect"]
+        hover_x = row_rect["x"] + row_rect["width"] - 40
+        hover_y = row_rect["y"] + row_rect["height"] / 2
+
+        page.mouse.move(hover_x, hover_y)
+        StealthUtils.random_delay(100, 250)
+        print("  ✓ Hovering over source row...")
+
+        # Now click the more_vert button that should be visible
+        # Use JavaScript to click the button within this specific row
+        click_result = row.evaluate("(row) => window.__nblmClickRowMenu(row)")
+
+        if click_result.get("clicked"):
+            print(f"  ✓ Clicked more options menu (method: {click_result.get('method')})")
+
+            # Look for delete option in the menu (menu item or button, one wait)
+            try:
+                delete_option = _delete_option(page)
+                delete_option.wait_for(state="visible", timeout=2000)
+                delete_option.click()
+                delete_clicked = True
+                print(f"  ✓ Clicked Delete in menu")
+            except Exception:
+                pass
+
+            if not delete_clicked:
+                page.keyboard.press("Escape")
+                StealthUtils.random_delay(100, 200)
+
+    except Exception as e:
+        print(f"  ⚠️ Error finding source row: {e}")
+
+    # Fallback: Try right-click context menu on the source row
+    if not delete_clicked:
+        print("  🔍 Trying right-click context menu...")
+        try:
+            # The matched row handle: no text selector to resolve (or mis-match)
+            row.click(button="right")
+
+            delete_option = _delete_option(page)
+            delete_option.wait_for(state="visible", timeout=2000)
+            delete_option.click()
+            delete_clicked = True
+            print(f"  ✓ Clicked Delete in context menu")
+        except Exception:
+            pass
+
+    if not delete_clicked:
+        screenshot = ("remove_source_no_delete.png", page.screenshot()) if debug else None
+        return {
+            "status": "error",
+            "error": "Could not find delete option. Source panel may need to be opened manually.",
+            "source": actual_source_name
+        }, screenshot
+
+    # Either a confirmation dialog opens or NotebookLM deletes straight away
+    # and the row leaves the list: wait in-page for whichever comes first
+    try:
+        outcome = page.wait_for_function(
+            """([row, dialogSelector]) => {
+                if (!row.isConnected || !row.getClientRects().length) return 'removed';
+                return document.querySelector(dialogSelector) ? 'dialog' : false;
+            }""",
+            arg=[row, CONFIRM_DIALOG_SELECTOR], polling="raf", timeout=10000
+        ).json_value()
+    except Exception:
+        outcome = None
+
+    if outcome is None:
+        screenshot = ("remove_source_unverified.png", page.screenshot()) if debug else None
+        return {
+            "status": "error",
+            "error": "Clicked Delete, but no confirmation dialog opened and the source is still listed",
+            "source": actual_source_name
+        }, screenshot
+
+    if outcome == "dialog":
+        if not confirm:
+            return {
+                "status": "error",
+                "error": "Deletion asks for confirmation, which was skipped; the source was not removed",
+                "source": actual_source_name
+            }, None
+        try:
+            confirm_btn = page.get_by_role("dialog").get_by_role(
+                "button", name=CONFIRM_NAME_RE
+            ).or_(page.locator(f"{CONFIRM_TEST_ID_SELECTOR}:visible")).first
+            confirm_btn.wait_for(state="visible", timeout=2000)
+            confirm_btn.click()
+            print(f"  ✓ Confirmed deletion")
+        except Exception:
+            pass
+
+        # Done once the row leaves the list (detached counts as hidden)
+        try:
+            row.wait_for_element_state("hidden", timeout=10000)
+        except Exception:
+            screenshot = ("remove_source_unconfirmed.png", page.screenshot()) if debug else None
+            return {
+                "status": "error",
+                "error": "Could not confirm deletion; the source is still listed",
+                "source": actual_source_name
+            }, screenshot
+    else:
+        print("  ℹ️ No confirmation dialog")
+
+    screenshot = None
+    if debug:
+        try:
+            screenshot = ("remove_source.png", page.screenshot())
+        except Exception as e:
+            print(f"  ⚠️ Could not take screenshot: {e}")
+
+    print(f"  ✅ Source removed: {actual_source_name[:60]}...")
+    return {"status": "success", "source": actual_source_name, "removed": True}, screenshot
 
 
 def remove_source(
@@ -24,7 +295,8 @@ def remove_source(
     notebook_id: str = None,
     headless: bool = True,
     debug: bool = False,
-    confirm: bool = True
+    confirm: bool = True,
+    use_daemon: bool = False
 ) -> dict:
     """
     Remove source from a NotebookLM notebook
@@ -35,307 +307,99 @@ def remove_source(
         notebook_name: Notebook name (fuzzy match)
         notebook_id: Notebook UUID
         headless: Run browser in headless mode
-        debug: Save screenshot for debugging
+        debug: Save screenshots and print a traceback on errors
         confirm: If True, confirm deletion in dialog
+        use_daemon: Start the browser daemon if it isn't running, so this and
+                    later commands attach to one warm browser
 
     Returns:
         Dict with status and result
     """
+    return remove_sources(
+        [source_name], notebook_url, notebook_name, notebook_id,
+        headless=headless, debug=debug, confirm=confirm, use_daemon=use_daemon
+    )[0]
+
+
+def remove_sources(
+    source_names: list,
+    notebook_url: str = None,
+    notebook_name: str = None,
+    notebook_id: str = None,
+    headless: bool = True,
+    debug: bool = False,
+    confirm: bool = True,
+    use_daemon: bool = False
+) -> list:
+    """
+    Remove several sources from one notebook in a single browser session
+
+    The notebook is opened and its Sources tab clicked once; each source is
+    then removed in turn on the same page.
+
+    Args:
+        source_names: Names of the sources to remove (partial match supported)
+        (other arguments as for remove_source)
+
+    Returns:
+        One result dict per source name, in the same order
+    """
     try:
         resolved_url = find_notebook_url(notebook_name, notebook_id, notebook_url)
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return [{"status": "error", "error": str(e)} for _ in source_names]
 
-    print(f"🗑️ Removing source: {source_name}")
+    print(f"🗑️ Removing source{'s' if len(source_names) > 1 else ''}: {', '.join(source_names)}")
     print(f"  📚 Notebook: {resolved_url}")
+    # The notebook's cached source list is about to go stale
+    set_cached_sources(resolved_url, None)
 
-    try:
-        with browser_session(headless=headless) as page:
-            print("  🌐 Opening notebook...")
-            page.goto(resolved_url, wait_until="domcontentloaded")
+    if use_daemon:
+        from browser_daemon import start as start_daemon
+        start_daemon(headless=headless)
 
-            page.wait_for_url(re.compile(r"^https://notebooklm\.google\.com/"), timeout=15000)
-            StealthUtils.random_delay(2000, 3000)
+    from browser_utils import browser_session
 
-            # Click on Sources tab
-            print("  🔍 Clicking Sources tab...")
-            for selector in SOURCES_TAB_SELECTORS:
-                try:
-                    tab = page.wait_for_selector(selector, timeout=5000, state="visible")
-                    if tab:
-                        tab.click()
-                        StealthUtils.random_delay(1500, 2500)
-                        break
-                except Exception:
-                    continue
-
-            # Find the source by name in the sources list (with retry for slow DOM rendering)
-            print(f"  🔍 Looking for source: {source_name}...")
-
-            found_source = None
-            deadline = time.time() + 30
-            while time.time() < deadline:
-                # Find the source row and its more options menu (without clicking the source itself)
-                found_source = page.evaluate('''(sourceName) => {
-                    const sourceNameLower = sourceName.toLowerCase();
-                    const bodyText = document.body.innerText;
-                    const lines = bodyText.split(String.fromCharCode(10));
-
-                    // Find the source in visible text
-                    for (const line of lines) {
-                        if (line.toLowerCase().indexOf(sourceNameLower) >= 0 &&
-                            line.toLowerCase().indexOf('select all') === -1 &&
-                            line.length > 10) {
-                            return { found: true, name: line.trim() };
-                        }
-                    }
-                    return { found: false };
-                }''', source_name)
-
-                if found_source and found_source.get("found"):
-                    break
-                time.sleep(2)
-
-            if not found_source or not found_source.get("found"):
-                print(f"  ❌ Source not found: {source_name}")
-                return {"status": "error", "error": f"Source not found: {source_name}"}
-
-            actual_source_name = found_source.get("name", source_name)
-            print(f"  ✓ Found source: {actual_source_name[:60]}...")
-
-            StealthUtils.random_delay(500, 1000)
-
-            # Look for delete option - find the specific source row and its menu button
-            print("  🔍 Looking for delete option...")
-
-            delete_clicked = False
-
-            # Use JavaScript to find the exact source row and click its menu button
-            try:
-                # Step 1: Find and hover over the specific source row to reveal the menu button
-                row_info = page.evaluate('''(sourceName) => {
-                    const sourceNameLower = sourceName.toLowerCase();
-
-                    // Find all mat-checkbox elements (each source has one)
-                    const checkboxes = document.querySelectorAll('mat-checkbox');
-
-                    for (const checkbox of checkboxes) {
-                        // Get the parent row element
-                        const row = checkbox.closest('[class*="source-row"]') ||
-                                   checkbox.closest('[class*="list-item"]') ||
-                                   checkbox.parentElement?.parentElement ||
-                                   checkbox.parentElement;
-
-                        if (!row) continue;
-
-                        // Check the text content of this row
-                        const rowText = row.innerText || row.textContent || '';
-
-                        // Match source name (but not "Select all sources")
-                        if (rowText.toLowerCase().indexOf(sourceNameLower) >= 0 &&
-                            rowText.toLowerCase().indexOf('select all') === -1) {
-
-                            // Found the matching row - get its bounding box
-                            const rect = row.getBoundingClientRect();
-
-                            // Also try to find the more_vert button within this row
-                            const moreBtn = row.querySelector('button[aria-label*="More"], button[aria-label*="more"], mat-icon');
-                            let btnRect = null;
-                            if (moreBtn) {
-                                btnRect = moreBtn.getBoundingClientRect();
-                            }
-
-                            return {
-                                found: true,
-                                rowRect: { x: rect.x, y: rect.y, width: rect.width, height: rect.height },
-                                btnRect: btnRect ? { x: btnRect.x, y: btnRect.y, width: btnRect.width, height: btnRect.height } : null,
-                                sourceName: rowText.split('\\n').filter(l => l.trim().length > 5 && l.toLowerCase().indexOf('select all') === -1)[0] || sourceName
-                            };
-                        }
-                    }
-
-                    return { found: false };
-                }''', source_name)
-
-                if not row_info.get("found"):
-                    print(f"  ⚠️ Could not find source row for: {source_name}")
-                else:
-                    print(f"  ✓ Found source row: {row_info.get('sourceName', source_name)[:50]}...")
-
-                    # Hover over the right side of the row to reveal the menu button
-                    row_rect = row_info["rowRect"]
-                    hover_x = row_rect["x"] + row_rect["width"] - 40
-                    hover_y = row_rect["y"] + row_rect["height"] / 2
-
-                    page.mouse.move(hover_x, hover_y)
-                    StealthUtils.random_delay(800, 1200)
-                    print("  ✓ Hovering over source row...")
-
-                    # Now click the more_vert button that should be visible
-                    # Use JavaScript to click the button within this specific row
-                    click_result = page.evaluate('''(sourceName) => {
-                        const sourceNameLower = sourceName.toLowerCase();
-                        const checkboxes = document.querySelectorAll('mat-checkbox');
-
-                        for (const checkbox of checkboxes) {
-                            const row = checkbox.closest('[class*="source-row"]') ||
-                                       checkbox.closest('[class*="list-item"]') ||
-                                       checkbox.parentElement?.parentElement ||
-                                       checkbox.parentElement;
-
-                            if (!row) continue;
-
-                            const rowText = row.innerText || row.textContent || '';
-
-                            if (rowText.toLowerCase().indexOf(sourceNameLower) >= 0 &&
-                                rowText.toLowerCase().indexOf('select all') === -1) {
-
-                                // Find and click the more button within THIS row
-                                const moreBtn = row.querySelector('button[aria-label*="More"], button[aria-label*="more"]') ||
-                                               row.querySelector('button:has(mat-icon)') ||
-                                               row.querySelector('mat-icon[fonticon="more_vert"]')?.closest('button') ||
-                                               row.querySelector('mat-icon')?.closest('button');
-
-                                if (moreBtn) {
-                                    moreBtn.click();
-                                    return { clicked: true, method: 'direct' };
-                                }
-
-                                // Fallback: try to find any clickable icon in the row
-                                const icons = row.querySelectorAll('mat-icon, button');
-                                for (const icon of icons) {
-                                    const iconText = icon.textContent || '';
-                                    if (iconText.indexOf('more') >= 0 || icon.getAttribute('aria-label')?.toLowerCase().indexOf('more') >= 0) {
-                                        icon.click();
-                                        return { clicked: true, method: 'icon' };
-                                    }
-                                }
-                            }
-                        }
-
-                        return { clicked: false };
-                    }''', source_name)
-
-                    if click_result.get("clicked"):
-                        print(f"  ✓ Clicked more options menu (method: {click_result.get('method')})")
-                        StealthUtils.random_delay(500, 1000)
-
-                        # Look for delete option in the menu
-                        delete_menu_selectors = [
-                            'button:has-text("Delete")',
-                            'button:has-text("Remove")',
-                            '[role="menuitem"]:has-text("Delete")',
-                            '[role="menuitem"]:has-text("Remove")',
-                        ]
-
-                        for del_selector in delete_menu_selectors:
-                            try:
-                                delete_option = page.wait_for_selector(del_selector, timeout=2000, state="visible")
-                                if delete_option:
-                                    delete_option.click()
-                                    delete_clicked = True
-                                    print(f"  ✓ Clicked Delete in menu")
-                                    StealthUtils.random_delay(500, 1000)
-                                    break
-                            except Exception:
-                                continue
-
-                        if not delete_clicked:
-                            page.keyboard.press("Escape")
-                            StealthUtils.random_delay(300, 500)
-
-            except Exception as e:
-                print(f"  ⚠️ Error finding source row: {e}")
-
-            # Fallback: Try right-click context menu on the source name
-            if not delete_clicked:
-                print("  🔍 Trying right-click context menu...")
-                try:
-                    # Use a more specific locator
-                    source_el = page.locator(f'text="{actual_source_name[:40]}"').first
-                    source_el.click(button="right")
-                    StealthUtils.random_delay(500, 1000)
-
-                    delete_option = page.wait_for_selector(
-                        '[role="menuitem"]:has-text("Delete"), [role="menuitem"]:has-text("Remove"), button:has-text("Delete")',
-                        timeout=2000,
-                        state="visible"
-                    )
-                    if delete_option:
-                        delete_option.click()
-                        delete_clicked = True
-                        print(f"  ✓ Clicked Delete in context menu")
-                except Exception:
-                    pass
-
-            if not delete_clicked:
-                if debug:
-                    debug_dir = Path(__file__).parent.parent / "data" / "debug"
-                    debug_dir.mkdir(parents=True, exist_ok=True)
-                    page.screenshot(path=str(debug_dir / "remove_source_no_delete.png"))
-                    print(f"  📸 Debug screenshot saved")
-
-                return {
-                    "status": "error",
-                    "error": "Could not find delete option. Source panel may need to be opened manually.",
-                    "source": actual_source_name
-                }
-
-            # Handle confirmation dialog
-            if confirm:
-                StealthUtils.random_delay(500, 1000)
-                confirm_selectors = [
-                    'button:has-text("Delete")',
-                    'button:has-text("Confirm")',
-                    'button:has-text("Yes")',
-                    'button:has-text("OK")',
-                    '[data-test-id="confirm-delete"]',
-                ]
-
-                for selector in confirm_selectors:
-                    try:
-                        confirm_btn = page.wait_for_selector(selector, timeout=2000, state="visible")
-                        if confirm_btn:
-                            confirm_btn.click()
-                            print(f"  ✓ Confirmed deletion")
-                            break
-                    except Exception:
-                        continue
-
-            StealthUtils.random_delay(1000, 2000)
-
-            if debug:
-                debug_dir = Path(__file__).parent.parent / "data" / "debug"
-                debug_dir.mkdir(parents=True, exist_ok=True)
+    results = []
+    # (filename, PNG bytes) captured in the session, written once the browser is closed
+    screenshots = []
+    try:
+        with browser_session(headless=headless) as page:
+            _open_sources_panel(page, resolved_url)
+            for source_name in source_names:
                 try:
-                    page.screenshot(path=str(debug_dir / "remove_source.png"))
-                    print(f"  📸 Screenshot saved to: {debug_dir / 'remove_source.png'}")
+                    result, screenshot = _remove_on_page(page, source_name, debug, confirm)
                 except Exception as e:
-                    print(f"  ⚠️ Could not save screenshot: {e}")
-
-            print(f"  ✅ Source removed: {actual_source_name[:60]}...")
-
-            set_last_notebook(resolved_url)
-
-            return {
-                "status": "success",
-                "source": actual_source_name,
-                "removed": True,
-                "notebook_url": resolved_url
-            }
+                    print(f"  ❌ Error: {e}")
+                    result, screenshot = {"status": "error", "error": str(e), "source": source_name}, None
+                result["notebook_url"] = resolved_url
+                results.append(result)
+                if screenshot:
+                    screenshots.append(screenshot)
 
     except Exception as e:
         print(f"  ❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
-        return {"status": "error", "error": str(e)}
+        if debug:
+            import traceback
+            traceback.print_exc()
+        while len(results) < len(source_names):
+            results.append({"status": "error", "error": str(e)})
+
+    # The browser is closed by now; the file and config writes don't keep it alive
+    for screenshot in screenshots:
+        _save_screenshot(*screenshot)
+    if any(r["status"] == "success" for r in results):
+        set_last_notebook(resolved_url)
+
+    return results
 
 
 def main():
     parser = argparse.ArgumentParser(description='Remove source from a NotebookLM notebook')
 
     # Source to remove
-    parser.add_argument('source_name', help='Name of the source to remove (partial match)')
+    parser.add_argument('source_name', nargs='+',
+                        help='Name of the source to remove (partial match); several names are removed in one session')
 
     # Notebook selection
     parser.add_argument('--notebook-url', help='Direct notebook URL')
@@ -345,25 +409,29 @@ def main():
     # Options
     parser.add_argument('--show-browser', action='store_true', help='Show browser for debugging')
     parser.add_argument('--json', action='store_true', help='Output as JSON')
-    parser.add_argument('--debug', action='store_true', help='Save screenshot for debugging')
+    parser.add_argument('--debug', action='store_true', help='Save screenshots and print tracebacks for debugging')
     parser.add_argument('--no-confirm', action='store_true', help='Skip confirmation dialog')
+    parser.add_argument('--use-daemon', action='store_true',
+                        help='Start the browser daemon if needed and run in it (later commands reuse it)')
 
     args = parser.parse_args()
 
-    result = remove_source(
-        source_name=args.source_name,
+    results = remove_sources(
+        args.source_name,
         notebook_url=args.notebook_url,
         notebook_name=args.notebook_name,
         notebook_id=args.notebook_id,
         headless=not args.show_browser,
         debug=args.debug,
-        confirm=not args.no_confirm
+        confirm=not args.no_confirm,
+        use_daemon=args.use_daemon
     )
 
     if args.json:
-        print(json.dumps(result, indent=2, ensure_ascii=False))
+        output = results[0] if len(results) == 1 else results
+        print(json.dumps(output, indent=2, ensure_ascii=False))
 
-    return 0 if result["status"] == "success" else 1
+    return 0 if all(r["status"] == "success" for r in results) else 1
 
 
 if __name__ == "__main__":
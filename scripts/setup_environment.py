@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Environment setup for NotebookLM skill
+Creates the skill's .venv, installs requirements.txt and the browser
+(run automatically by run.py on first use)
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+
+SKILL_DIR = Path(__file__).parent.parent
+VENV_DIR = SKILL_DIR / ".venv"
+REQUIREMENTS_FILE = SKILL_DIR / "requirements.txt"
+
+
+def get_venv_python() -> Path:
+    """Path of the virtual environment's Python executable"""
+    if os.name == 'nt':  # Windows
+        return VENV_DIR / "Scripts" / "python.exe"
+    return VENV_DIR / "bin" / "python"
+
+
+def create_venv(uv: str | None) -> bool:
+    """Create .venv (with uv when it is available, else the venv module)"""
+    print(f"📦 Creating virtual environment in {VENV_DIR}...")
+    if uv:
+        cmd = [uv, "venv", "--python", sys.executable, str(VENV_DIR)]
+    else:
+        cmd = [sys.executable, "-m", "venv", str(VENV_DIR)]
+    return subprocess.run(cmd).returncode == 0
+
+
+def read_requirements() -> list[str]:
+    """Requirement specifiers from requirements.txt (comments and blanks dropped)"""
+    lines = (line.split("#", 1)[0].strip() for line in REQUIREMENTS_FILE.read_text().splitlines())
+    return [line for line in lines if line]
+
+
+def install_requirements(uv: str | None, requirements: list[str]) -> bool:
+    """
+    Install requirement specifiers into .venv
+
+    uv resolves and unpacks wheels in parallel; without it, a single pip run
+    with --no-compile (no separate "pip install --upgrade pip" cold start,
+    no byte-compiling every installed module up front).
+    """
+    venv_python = str(get_venv_python())
+    if uv:
+        cmd = [uv, "pip", "install", "--python", venv_python, *requirements]
+    else:
+        cmd = [venv_python, "-m", "pip", "install", "--no-compile",
+               "--disable-pip-version-check", *requirements]
+    return subprocess.run(cmd).returncode == 0
+
+
+def start_browser_install() -> subprocess.Popen:
+    """Start installing the Chrome build patchright drives (BrowserFactory uses channel="chrome")"""
+    print("🌐 Installing browser (in the background)...")
+    cmd = [str(get_venv_python()), "-m", "patchright", "install", "chrome"]
+    return subprocess.Popen(cmd)
+
+
+def main():
+    """Set up the environment; returns a process exit code"""
+    uv = shutil.which("uv")
+    if uv:
+        print("⚡ Using uv for a faster install")
+
+    if not get_venv_python().exists() and not create_venv(uv):
+        print("❌ Failed to create virtual environment")
+        return 1
+
+    # patchright goes in first, on its own: the browser download only needs
+    # it, so it can then run alongside the rest of the dependency install
+    requirements = read_requirements()
+    browser_reqs = [r for r in requirements if r.lower().startswith("patchright")]
+    other_reqs = [r for r in requirements if r not in browser_reqs]
+
+    print("📥 Installing patchright...")
+    if not install_requirements(uv, browser_reqs):
+        print("❌ Failed to install patchright")
+        return 1
+
+    browser_install = start_browser_install()
+    deps_ok = True
+    if other_reqs:
+        print("📥 Installing remaining dependencies...")
+        deps_ok = install_requirements(uv, other_reqs)
+    browser_ok = browser_install.wait() == 0
+
+    if not deps_ok:
+        print("❌ Failed to install dependencies")
+        return 1
+    if not browser_ok:
+        print("❌ Failed to install browser")
+        return 1
+
+    print("✅ Environment ready")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Shared fixtures for the NotebookLM skill tests
+"""
+
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Skill scripts are plain modules, not an installed package
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / 'scripts'
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+# Integration guard: allow CI to opt-out with SKIP_INTEGRATION=1
+SKIP_INTEGRATION = os.environ.get("SKIP_INTEGRATION", "").lower() in ("1", "true", "yes")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "integration: drives the real NotebookLM web app")
+    config.addinivalue_line("markers", "slow: waits on a NotebookLM chat answer (deselect with -m 'not slow')")
+
+    # Every skill call drives the same persistent Chrome profile (or the one
+    # daemon attached to it), and Chrome allows one process per profile, so
+    # live runs can't be spread over pytest-xdist workers
+    if not SKIP_INTEGRATION and getattr(config.option, "numprocesses", None):
+        raise pytest.UsageError(
+            "Integration tests share one Chrome profile and can't run under "
+            "pytest-xdist; run them with -p no:xdist (or -n 0)"
+        )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip integration tests once at collection when SKIP_INTEGRATION is set"""
+    if not SKIP_INTEGRATION:
+        return
+    skip = pytest.mark.skip(reason="SKIP_INTEGRATION is set — skipping integration tests")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def skill_api():
+    """
+    The skill functions the workflows call, imported on first use
+
+    Importing them runs every script's top-level code, so a run where all
+    integration tests are skipped never pays for it.
+    """
+    from create_notebook import create_notebook
+    from delete_notebook import delete_notebook
+    from add_source import add_url_source, add_file_source, add_sources
+    from ask_question import ask_notebooklm
+    from list_notebooks import list_notebooks
+    from list_sources import list_sources
+    from remove_source import remove_source
+    from download_source import download_source
+
+    return SimpleNamespace(
+        create_notebook=create_notebook,
+        delete_notebook=delete_notebook,
+        add_url_source=add_url_source,
+        add_file_source=add_file_source,
+        add_sources=add_sources,
+        ask_notebooklm=ask_notebooklm,
+        list_notebooks=list_notebooks,
+        list_sources=list_sources,
+        remove_source=remove_source,
+        download_source=download_source,
+    )
+
+
+@pytest.fixture(scope="session")
+def warm_browser():
+    """
+    One browser daemon for the whole run, when USE_BROWSER_DAEMON=1
+
+    Every skill call attaches to it over CDP instead of launching Chrome
+    on its own. A daemon that was already running is left running. Opt-in,
+    like the daemon itself: it exposes the logged-in profile on a local
+    DevTools port (see SKILL.md).
+    """
+    if os.environ.get("USE_BROWSER_DAEMON", "").lower() not in ("1", "true", "yes"):
+        yield None
+        return
+
+    import browser_daemon
+
+    already_running = browser_daemon.get_daemon_info() is not None
+    info = browser_daemon.start()
+    yield info
+    if info and not already_running:
+        browser_daemon.stop()
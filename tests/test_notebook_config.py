@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Unit tests for notebook_config's config.json handling
+
+Not an integration test: runs even with SKIP_INTEGRATION=1, and needs no
+browser or Google account. Every test works on a config.json in tmp_path.
+"""
+
+import json
+import os
+
+import pytest
+
+import notebook_config
+
+NOTEBOOK_ID = "0a1b2c3d-4e5f-6789-abcd-ef0123456789"
+
+
+@pytest.fixture(autouse=True)
+def config_file(tmp_path, monkeypatch):
+    """Point notebook_config at a fresh config.json, with no memoized state"""
+    path = tmp_path / "config.json"
+    monkeypatch.setattr(notebook_config, "CONFIG_FILE", path)
+    monkeypatch.setattr(notebook_config, "_config_cache", {"mtime": None, "config": None})
+    monkeypatch.setattr(notebook_config, "_resolved_names", {})
+    return path
+
+
+def _write(path, config: dict, mtime: float):
+    """Write config.json with a fixed mtime, so memoization is deterministic"""
+    path.write_text(json.dumps(config), encoding="utf-8")
+    os.utime(path, (mtime, mtime))
+
+
+def test_match_notebook_prefers_exact_over_partial():
+    notebooks = [
+        {"name": "Research Notes (old)", "url": "partial"},
+        {"name": "research notes", "url": "exact"},
+    ]
+    assert notebook_config._match_notebook(notebooks, "Research Notes")["url"] == "exact"
+    assert notebook_config._match_notebook(notebooks, "notes (OLD")["url"] == "partial"
+    assert notebook_config._match_notebook(notebooks, "missing") is None
+
+
+def test_update_config_none_removes_key(config_file):
+    notebook_config.update_config(a=1, b=2)
+    config = notebook_config.update_config(a=None, missing=None)
+    assert config == {"b": 2}
+    assert json.loads(config_file.read_text(encoding="utf-8")) == {"b": 2}
+
+
+def test_update_config_skips_write_when_unchanged(monkeypatch):
+    notebook_config.update_config(a=1)
+
+    saves = []
+    monkeypatch.setattr(notebook_config, "_save_config", saves.append)
+    notebook_config.update_config(a=1, missing=None)
+    assert saves == []
+
+    notebook_config.update_config(a=2)
+    assert saves == [{"a": 2}]
+
+
+def test_load_config_memoized_by_mtime(config_file):
+    _write(config_file, {"a": 1}, mtime=1000)
+    assert notebook_config._load_config() == {"a": 1}
+
+    # Same mtime: the memoized dict is returned without re-reading the file
+    _write(config_file, {"a": 2}, mtime=1000)
+    assert notebook_config._load_config() == {"a": 1}
+
+    _write(config_file, {"a": 2}, mtime=2000)
+    assert notebook_config._load_config() == {"a": 2}
+
+
+def test_load_config_returns_a_copy(config_file):
+    _write(config_file, {"sources": {"nb": {"sources": ["one"]}}}, mtime=1000)
+    loaded = notebook_config._load_config()
+    loaded["sources"]["nb"]["sources"].append("two")
+    assert notebook_config._load_config() == {"sources": {"nb": {"sources": ["one"]}}}
+
+
+def test_set_last_notebook_extracts_id_from_url():
+    notebook_config.set_last_notebook(f"https://notebooklm.google.com/notebook/{NOTEBOOK_ID}?authuser=0", "Notes")
+    last = notebook_config.get_last_notebook()
+    assert last["id"] == NOTEBOOK_ID
+    assert last["url"] == f"https://notebooklm.google.com/notebook/{NOTEBOOK_ID}"
+    assert last["name"] == "Notes"
+
+
+def test_config_round_trips_utf8(config_file):
+    notebook_config.set_last_notebook(NOTEBOOK_ID, "Notizen – Übersicht 日本語")
+    notebook_config._config_cache.update(mtime=None, config=None)
+    assert notebook_config.get_last_notebook()["name"] == "Notizen – Übersicht 日本語"
+    assert "Übersicht" in config_file.read_text(encoding="utf-8")
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Import smoke test for the skill scripts
+
+Not an integration test: runs even with SKIP_INTEGRATION=1, and needs no
+browser or Google account.
+"""
+
+import importlib
+
+SKILL_MODULES = [
+    "create_notebook",
+    "delete_notebook",
+    "add_source",
+    "ask_question",
+    "list_notebooks",
+    "list_sources",
+    "remove_source",
+    "download_source",
+]
+
+
+def test_scripts_import():
+    """Every script imports cleanly (scripts/ is on sys.path via conftest.py)"""
+    for module in SKILL_MODULES:
+        importlib.import_module(module)
@@ -1,189 +1,224 @@
 #!/usr/bin/env python3
 """
-AUTO-GENERATED - DO NOT EDIT
+Integration tests for the NotebookLM skill's real workflows
 
-This file was auto-generated from SKILL.md by integration-test-generator.
-Generated: 2026-02-10 16:10:33
+Originally generated from SKILL.md by integration-test-generator, now
+maintained by hand.
 
-To modify test behavior:
-  1. Update SKILL.md with better workflow examples
-  2. Use integration-test-generator skill to regenerate
-
-Manual edits will be lost when regenerated!
-
-Coverage: 3/3 real workflows (100%)
-Identified using AI scenario recognition with complete code generation
-
-Coverage Report:
-  ✅ Create Notebook → Add URL Source → Ask Question → Delete Notebook
-  ✅ Create Notebook → Add File Source → List Sources (verify) → Ask Question → Delete Notebook
-  ✅ Create Notebook → Add URL Source → Download Source → Remove Source → Delete Notebook
+Coverage Report (every workflow runs in one shared notebook: Create Notebook → ... → Delete Notebook):
+  ✅ Add URL Source → Ask Question
+  ✅ Add File Source (verify) → Ask Question
+  ✅ Add URL Source → List Sources (verify) → Download Source → Remove Source
+  ✅ Add Mixed Sources (file + URL, one session; verify per-item results)
 
 Uncovered workflows: None
 """
 
 # Standard library imports
-import os
-from pathlib import Path
+import random
+import time
+import uuid
+import warnings
 
 # Third-party imports
 import pytest
 
-# Skill-specific imports
-import sys
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
-from create_notebook import create_notebook
-from delete_notebook import delete_notebook
-from add_source import add_url_source, add_file_source
-from ask_question import ask_notebooklm
-from list_notebooks import list_notebooks
-from list_sources import list_sources
-from remove_source import remove_source
-from download_source import download_source
-
-# Integration guard: allow CI to opt-out with SKIP_INTEGRATION=1
-SKIP_INTEGRATION = os.environ.get("SKIP_INTEGRATION", "").lower() in ("1", "true", "yes")
-
-
-@pytest.fixture(autouse=True)
-def _integration_guard():
-    """Skip if SKIP_INTEGRATION is set."""
-    if SKIP_INTEGRATION:
-        pytest.skip("SKIP_INTEGRATION is set — skipping integration tests")
+# Skill functions come from the skill_api fixture (conftest.py), imported lazily
 
+# Integration guard: CI opts out with SKIP_INTEGRATION=1 (applied at collection, see conftest.py)
+pytestmark = pytest.mark.integration
 
 
+def _unique_name(label: str) -> str:
+    """
+    Notebook name unique to this run
 
-def test_research_with_url_source():
+    A notebook left behind by an aborted run can't be picked up, or
+    fuzzy-matched, by the next one.
     """
-    Real scenario: Create notebook, add URL source, query, and cleanup
+    return f"Integration Test - {label} - {uuid.uuid4().hex[:8]}"
 
-    Workflow: Create Notebook → Add URL Source → Ask Question → Delete Notebook
 
-    User problem: Researcher creates a temporary knowledge base from a web article, queries it for answers, then cleans up
+@pytest.fixture(scope="module")
+def shared_notebook(skill_api, warm_browser):
+    """
+    One test notebook shared by every workflow in this module
 
-    Data flow:
-      1. create_notebook creates a fresh test notebook, returns dict with notebook_url and notebook_id
-      2. add_url_source adds a Wikipedia article as source material
-      3. ask_notebooklm queries the notebook, returns answer string from the source
-      4. delete_notebook removes the test notebook (test data isolation)
+    Created once and deleted at teardown, instead of a create/delete pair per
+    workflow. Each workflow removes the sources it added, so no state leaks
+    between them.
     """
-    # Step 1: create_notebook creates a fresh test notebook, returns dict with notebook_url and notebook_id
-    nb = create_notebook(name='Integration Test - URL Research')
+    nb = skill_api.create_notebook(name=_unique_name('Workflows'))
     assert nb["status"] == "success"
     assert nb['notebook_id'] is not None
-    notebook_url = nb["notebook_url"]  # Extract for next step
 
-    try:
-        # Step 2: add_url_source adds a Wikipedia article as source material
-        add_result = add_url_source(notebook_url=notebook_url, source_url='https://en.wikipedia.org/wiki/Artificial_intelligence')
-        assert add_result["status"] == "success"
+    yield nb
 
-        # Step 3: ask_notebooklm queries the notebook, returns answer string from the source
-        answer = ask_notebooklm(question='What is artificial intelligence? Give a brief definition.', notebook_url=notebook_url)
-        assert isinstance(answer, str)
-        assert len(answer) > 10
+    # Test data isolation: the notebook goes away with the module
+    cleanup = skill_api.delete_notebook(notebook_id=nb['notebook_id'], confirm=True)
+    assert cleanup["status"] == "success"
 
-    finally:
-        # Step 4: delete_notebook removes the test notebook (test data isolation)
-        cleanup = delete_notebook(notebook_id=nb['notebook_id'], confirm=True)
-        assert cleanup["status"] == "success"
+
+def _is_answer(answer) -> bool:
+    """A real answer, not None or an empty/placeholder reply"""
+    return isinstance(answer, str) and len(answer) > 10
 
 
+def _assert_answer(answer):
+    """Fail at once with the bad value, instead of separate isinstance/len asserts"""
+    if not _is_answer(answer):
+        pytest.fail(f"Bad answer: {answer!r}")
 
-def test_file_source_with_verification(tmp_path):
+
+def _remove_source_quietly(api, source_name: str, notebook_url: str):
     """
-    Real scenario: Upload file, verify in sources list, query, and cleanup
+    Workflow cleanup that never raises, so it can't mask the failure being cleaned up after
 
-    Workflow: Create Notebook → Add File Source → List Sources (verify) → Ask Question → Delete Notebook
+    A source left behind stays in the shared notebook for the next workflows,
+    so a failed removal (remove_source reports it in its result, not by
+    raising) is surfaced as a warning in the pytest summary.
+    """
+    try:
+        result = api.remove_source(source_name=source_name, notebook_url=notebook_url)
+    except Exception as e:
+        result = {"status": "error", "error": str(e)}
+    if result.get("status") != "success":
+        warnings.warn(f"Cleanup: could not remove source {source_name!r} from the shared notebook: "
+                      f"{result.get('error', 'unknown error')}")
 
-    User problem: User uploads a document to NotebookLM, verifies it appears in the sources, then queries for information from it
 
-    Data flow:
-      1. create_notebook creates a fresh test notebook
-      2. Create test file, then add_file_source uploads it as a notebook source
-      3. list_sources verifies the uploaded file appears in the notebook's sources
-      4. ask_notebooklm queries the uploaded content to verify it's searchable
-      5. delete_notebook removes the test notebook (test data isolation)
+def _ask_with_retry(api, question: str, notebook_url: str, attempts: int = 3) -> str | None:
     """
-    # Step 1: create_notebook creates a fresh test notebook
-    nb = create_notebook(name='Integration Test - File Upload')
-    assert nb["status"] == "success"
-    assert nb['notebook_id'] is not None
-    notebook_url = nb["notebook_url"]  # Extract for next step
+    ask_notebooklm, retried with exponential backoff and jitter
+
+    ask_notebooklm returns None on a transient failure (timeout, no response
+    rendered); one retry costs a few seconds, a failed run costs the whole suite.
+    """
+    answer = None
+    for attempt in range(attempts):
+        answer = api.ask_notebooklm(question=question, notebook_url=notebook_url)
+        if _is_answer(answer):
+            return answer
+        if attempt < attempts - 1:
+            time.sleep(min(0.5 * 2 ** attempt, 4) + random.uniform(0, 0.5))
+    return answer
 
-    try:
-        # Step 2: Create test file, then add_file_source uploads it as a notebook source
-        test_file = str(tmp_path / 'test_notes.txt')
-        Path(test_file).write_text('The Python programming language was created by Guido van Rossum in 1991. It emphasizes code readability and simplicity.')
-        add_result = add_file_source(notebook_url=notebook_url, file_path=test_file)
-        assert add_result["status"] == "success"
-
-        # Step 3: list_sources verifies the uploaded file appears in the notebook's sources
-        sources_result = list_sources(notebook_url=notebook_url)
-        assert sources_result["status"] == "success"
 
-        # Step 4: ask_notebooklm queries the uploaded content to verify it's searchable
-        answer = ask_notebooklm(question='Who created Python and when?', notebook_url=notebook_url)
-        assert isinstance(answer, str)
-        assert len(answer) > 10
+@pytest.fixture(scope="session")
+def python_notes_file(tmp_path_factory):
+    """Small text file for the upload workflow, written once per session"""
+    path = tmp_path_factory.mktemp("notes") / "test_notes.txt"
+    path.write_text('The Python programming language was created by Guido van Rossum in 1991. It emphasizes code readability and simplicity.')
+    return str(path)
 
+
+def _workflow_url_research(api, notebook_url, notes_file):
+    """
+    Add URL Source → Ask Question
+
+    User problem: Researcher builds a temporary knowledge base from a web article and queries it for answers
+    """
+    # add_url_source adds a Wikipedia article as source material
+    add_result = api.add_url_source(notebook_url=notebook_url, source_url='https://en.wikipedia.org/wiki/Artificial_intelligence')
+    assert add_result["status"] == "success"
+
+    try:
+        # ask_notebooklm queries the notebook, returns answer string from the source (retried on transient failure)
+        answer = _ask_with_retry(api, 'What is artificial intelligence? Give a brief definition.', notebook_url)
+        _assert_answer(answer)
     finally:
-        # Step 5: delete_notebook removes the test notebook (test data isolation)
-        cleanup = delete_notebook(notebook_id=nb['notebook_id'], confirm=True)
-        assert cleanup["status"] == "success"
+        _remove_source_quietly(api, 'Artificial intelligence', notebook_url)
 
 
+def _workflow_file_upload(api, notebook_url, notes_file):
+    """
+    Add File Source (verify) → Ask Question
 
-def test_source_management_lifecycle():
+    User problem: User uploads a document, verifies it appears in the sources, then queries information from it
     """
-    Real scenario: Add source, download content, remove source, cleanup
+    # add_file_source uploads the staged notes file as a notebook source
+    add_result = api.add_file_source(notebook_url=notebook_url, file_path=notes_file)
+    assert add_result["status"] == "success"
 
-    Workflow: Create Notebook → Add URL Source → Download Source → Remove Source → Delete Notebook
+    try:
+        # add_file_source returns the notebook's source names; the upload must be among them
+        assert any(name.startswith('test_notes') for name in add_result.get("sources", []))
+
+        # ask_notebooklm queries the uploaded content to verify it's searchable (retried on transient failure)
+        answer = _ask_with_retry(api, 'Who created Python and when?', notebook_url)
+        _assert_answer(answer)
+    finally:
+        _remove_source_quietly(api, 'test_notes', notebook_url)
 
-    User problem: User manages notebook sources: adds a URL, downloads its extracted content for offline use, then removes the source and cleans up
 
-    Data flow:
-      1. create_notebook creates a fresh test notebook
-      2. add_url_source adds a Wikipedia article about Python as a source
-      3. download_source extracts the source content for offline use
-      4. remove_source deletes the source from the notebook
-      5. delete_notebook removes the test notebook (test data isolation)
+def _workflow_source_mgmt(api, notebook_url, notes_file):
     """
-    # Step 1: create_notebook creates a fresh test notebook
-    nb = create_notebook(name='Integration Test - Source Mgmt')
-    assert nb["status"] == "success"
-    assert nb['notebook_id'] is not None
-    notebook_url = nb["notebook_url"]  # Extract for next step
+    Add URL Source → List Sources (verify) → Download Source → Remove Source
 
+    User problem: User adds a URL, checks it in the source list, downloads its extracted content for offline use, then removes the source
+    """
+    # add_url_source adds a Wikipedia article about Python as a source
+    add_result = api.add_url_source(notebook_url=notebook_url, source_url='https://en.wikipedia.org/wiki/Python_(programming_language)')
+    assert add_result["status"] == "success"
+
+    removed = False
     try:
-        # Step 2: add_url_source adds a Wikipedia article about Python as a source
-        add_result = add_url_source(notebook_url=notebook_url, source_url='https://en.wikipedia.org/wiki/Python_(programming_language)')
-        assert add_result["status"] == "success"
+        # list_sources shows the new source in the notebook's source list
+        sources_result = api.list_sources(notebook_url=notebook_url)
+        assert sources_result["status"] == "success"
+        assert any('Python' in source["name"] for source in sources_result["sources"])
 
-        # Step 3: download_source extracts the source content for offline use
-        download_result = download_source(source_name='Python', notebook_url=notebook_url)
+        # download_source extracts the source content for offline use
+        download_result = api.download_source(source_name='Python', notebook_url=notebook_url)
         assert download_result["status"] == "success"
         assert download_result.get('content_length', 0) > 0
 
-        # Step 4: remove_source deletes the source from the notebook
-        remove_result = remove_source(source_name='Python', notebook_url=notebook_url)
+        # remove_source deletes the source from the notebook
+        remove_result = api.remove_source(source_name='Python', notebook_url=notebook_url)
         assert remove_result["status"] == "success"
-
+        removed = True
     finally:
-        # Step 5: delete_notebook removes the test notebook (test data isolation)
-        cleanup = delete_notebook(notebook_id=nb['notebook_id'], confirm=True)
-        assert cleanup["status"] == "success"
-
-# Smoke test - can import without errors
-def test_imports_work():
-    """Verify all imports are valid"""
-    assert create_notebook is not None
-    assert delete_notebook is not None
-    assert add_url_source is not None
-    assert ask_notebooklm is not None
-    assert list_notebooks is not None
-    assert list_sources is not None
-    assert remove_source is not None
-    assert download_source is not None
+        # Only when a step above failed before the source was removed
+        if not removed:
+            _remove_source_quietly(api, 'Python', notebook_url)
+
+
+def _workflow_batch_add(api, notebook_url, notes_file):
+    """
+    Add Mixed Sources (file + URL, one session; verify per-item results)
+
+    User problem: User adds a local document and a web article in one go and checks which of them made it in
+    """
+    url = 'https://en.wikipedia.org/wiki/Machine_learning'
+    # The file goes first: add_sources uploads files after the URL batch, but reports in input order
+    sources = [{"type": "file", "path": notes_file}, {"type": "url", "url": url}]
 
+    try:
+        results = api.add_sources(notebook_url=notebook_url, sources=sources)
+        assert len(results) == 2
+        assert results[0].get("file_name") == 'test_notes.txt'
+        assert results[1].get("source_url") == url
+        assert [r["status"] for r in results] == ["success", "success"]
+    finally:
+        _remove_source_quietly(api, 'test_notes', notebook_url)
+        _remove_source_quietly(api, 'Machine learning', notebook_url)
+
+
+WORKFLOWS = {
+    "url_research": _workflow_url_research,
+    "file_upload": _workflow_file_upload,
+    "source_mgmt": _workflow_source_mgmt,
+    "batch_add": _workflow_batch_add,
+}
+
+
+# Run one with -k url_research; -m "not slow" skips the ones that wait on an LLM answer
+@pytest.mark.parametrize("workflow", [
+    pytest.param("url_research", marks=pytest.mark.slow),
+    pytest.param("file_upload", marks=pytest.mark.slow),
+    "source_mgmt",
+    "batch_add",
+], ids=["url_research", "file_upload", "source_mgmt", "batch_add"])
+def test_workflow(skill_api, shared_notebook, workflow, python_notes_file):
+    """Run one real workflow against the shared notebook (file_upload and batch_add upload python_notes_file)"""
+    WORKFLOWS[workflow](skill_api, shared_notebook["notebook_url"], python_notes_file)